@@ -0,0 +1,183 @@
+"""
+Parallel Numba kernels for large client-side draws of
+:mod:`hana_ml.algorithms.pal.random`.
+
+The output is split into blocks of fixed size, each generated by its own
+xoroshiro128+ state seeded with SplitMix64 from the seed and the block
+number. Blocks are spread over the available cores, and the samples of a
+given seed do not depend on the number of threads.
+
+numba is optional. When it cannot be imported, AVAILABLE is False and the
+kernels are plain, slow Python functions that callers should not use.
+NUM_THREADS is the number of threads numba runs the kernels on.
+
+The kernels are compiled on first use, which makes the first large draw
+take seconds longer. They are cached on disk, so only the first run pays
+that cost; later processes load them instead of compiling them again.
+"""
+
+#pylint: disable=invalid-name
+import math
+import numpy as np
+try:
+    from numba import config, njit, prange
+    AVAILABLE = True
+    NUM_THREADS = config.NUMBA_NUM_THREADS
+except ImportError as error:
+    AVAILABLE = False
+    NUM_THREADS = 1
+    prange = range
+
+    def njit(*args, **kwargs):#pylint: disable=unused-argument
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Samples drawn from one generator state.
+_BLOCK = 1 << 16
+
+_SPLITMIX_GAMMA = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_S11, _S16, _S24, _S27, _S30, _S31, _S37 = [np.uint64(k) for k in (11, 16, 24, 27, 30, 31, 37)]
+_S64 = np.uint64(64)
+_TO_UNIT = 1.0 / (1 << 53)
+
+@njit(cache=True)
+def _splitmix64(x):
+    x = (x ^ (x >> _S30)) * _MIX1
+    x = (x ^ (x >> _S27)) * _MIX2
+    return x ^ (x >> _S31)
+
+@njit(cache=True)
+def _block_state(seed, block):
+    state = np.empty(2, np.uint64)
+    x = np.uint64(seed) + np.uint64(block) * _SPLITMIX_GAMMA
+    state[0] = _splitmix64(x + _SPLITMIX_GAMMA)
+    state[1] = _splitmix64(x + _SPLITMIX_GAMMA + _SPLITMIX_GAMMA)
+    return state
+
+@njit(cache=True)
+def _rotl(x, k):
+    return (x << k) | (x >> (_S64 - k))
+
+@njit(cache=True)
+def _next_double(state):
+    """Uniform draw in [0, 1) from a xoroshiro128+ state, advancing it."""
+    s0 = state[0]
+    s1 = state[1]
+    result = s0 + s1
+    s1 ^= s0
+    state[0] = _rotl(s0, _S24) ^ s1 ^ (s1 << _S16)
+    state[1] = _rotl(s1, _S37)
+    return (result >> _S11) * _TO_UNIT
+
+@njit(cache=True)
+def _draw_uniform(state, low, high):
+    return low + (high - low) * _next_double(state)
+
+@njit(cache=True)
+def _std_normal(state):
+    # Marsaglia's polar method, keeping one of the two values.
+    while True:
+        u = 2.0 * _next_double(state) - 1.0
+        v = 2.0 * _next_double(state) - 1.0
+        s = u * u + v * v
+        if 0.0 < s < 1.0:
+            return u * math.sqrt(-2.0 * math.log(s) / s)
+
+@njit(cache=True)
+def _draw_normal(state, mean, sd):
+    return mean + sd * _std_normal(state)
+
+@njit(cache=True)
+def _draw_gamma(state, shape, scale):
+    # Marsaglia and Tsang, boosted by U**(1/shape) for shape < 1.
+    boost = 1.0
+    if shape < 1.0:
+        boost = (1.0 - _next_double(state)) ** (1.0 / shape)
+        shape += 1.0
+    d = shape - 1.0 / 3.0
+    c = 1.0 / math.sqrt(9.0 * d)
+    while True:
+        x = _std_normal(state)
+        v = 1.0 + c * x
+        if v <= 0.0:
+            continue
+        v = v * v * v
+        u = 1.0 - _next_double(state)
+        if math.log(u) < 0.5 * x * x + d - d * v + d * math.log(v):
+            return scale * d * v * boost
+
+@njit(cache=True)
+def _draw_poisson(state, lam):
+    if lam < 10.0:
+        # Multiplication of uniforms, cheap for small means.
+        limit = math.exp(-lam)
+        k = 0
+        prod = 1.0 - _next_double(state)
+        while prod > limit:
+            k += 1
+            prod *= 1.0 - _next_double(state)
+        return float(k)
+    # Transformed rejection with squeeze (Hoermann's PTRS).
+    slam = math.sqrt(lam)
+    loglam = math.log(lam)
+    b = 0.931 + 2.53 * slam
+    a = -0.059 + 0.02483 * b
+    invalpha = 1.1239 + 1.1328 / (b - 3.4)
+    vr = 0.9277 - 3.6224 / (b - 2.0)
+    while True:
+        u = _next_double(state) - 0.5
+        v = _next_double(state)
+        us = 0.5 - abs(u)
+        k = math.floor((2.0 * a / us + b) * u + lam + 0.43)
+        if us >= 0.07 and v <= vr:
+            return k
+        if k < 0.0 or (us < 0.013 and v > us):
+            continue
+        if (math.log(v) + math.log(invalpha) - math.log(a / (us * us) + b) <=
+                -lam + k * loglam - math.lgamma(k + 1.0)):
+            return k
+
+@njit(cache=True)
+def _block_end(block, size):
+    return min(size, (block + 1) * _BLOCK)
+
+# Each kernel(seed, size, param1, param2) fills a float64 array of `size`
+# samples, block by block in parallel.
+@njit(parallel=True, cache=True)
+def uniform(seed, size, low, high):
+    out = np.empty(size, np.float64)
+    for block in prange((size + _BLOCK - 1) // _BLOCK):#pylint: disable=not-an-iterable
+        state = _block_state(seed, block)
+        for i in range(block * _BLOCK, _block_end(block, size)):
+            out[i] = _draw_uniform(state, low, high)
+    return out
+
+@njit(parallel=True, cache=True)
+def normal(seed, size, mean, sd):
+    out = np.empty(size, np.float64)
+    for block in prange((size + _BLOCK - 1) // _BLOCK):#pylint: disable=not-an-iterable
+        state = _block_state(seed, block)
+        for i in range(block * _BLOCK, _block_end(block, size)):
+            out[i] = _draw_normal(state, mean, sd)
+    return out
+
+@njit(parallel=True, cache=True)
+def gamma(seed, size, shape, scale):
+    out = np.empty(size, np.float64)
+    for block in prange((size + _BLOCK - 1) // _BLOCK):#pylint: disable=not-an-iterable
+        state = _block_state(seed, block)
+        for i in range(block * _BLOCK, _block_end(block, size)):
+            out[i] = _draw_gamma(state, shape, scale)
+    return out
+
+@njit(parallel=True, cache=True)
+def poisson(seed, size, lam):
+    out = np.empty(size, np.float64)
+    for block in prange((size + _BLOCK - 1) // _BLOCK):#pylint: disable=not-an-iterable
+        state = _block_state(seed, block)
+        for i in range(block * _BLOCK, _block_end(block, size)):
+            out[i] = _draw_poisson(state, lam)
+    return out
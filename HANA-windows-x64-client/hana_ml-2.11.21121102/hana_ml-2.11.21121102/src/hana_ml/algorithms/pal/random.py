@@ -22,19 +22,34 @@ The following distribution functions are available:
     * :func:`uniform`
     * :func:`weibull`
     * :func:`multinomial`
+    * :func:`batch_random`
     * :func:`mcmc`
+    * :func:`mcmc_batch`
+
+Seeds of calls made without one can be made reproducible per thread with
+:func:`seed_stream`.
 """
 
 # pylint: disable=too-many-lines, invalid-name
 # pylint: disable=consider-using-f-string
+import collections
+import functools
+import inspect
+import json
 import logging
+import os
+import threading
 import uuid
 import numpy as np
+import pandas as pd
 try:
     import pyodbc
 except ImportError as error:
     pass
 from hdbcli import dbapi
+from hana_ml.dataframe import quotename, create_dataframe_from_pandas
+from hana_ml.ml_base import sql_for_insert_values
+from hana_ml.algorithms.pal import sqlgen
 from .pal_base import (
     Table,
     ParameterTable,
@@ -43,51 +58,879 @@ from .pal_base import (
     arg,
     create,
     try_drop,
+    execute_logged,
     call_pal_auto_with_hint,
     require_pal_usable,
 )
 
 logger = logging.getLogger(__name__)#pylint: disable=invalid-name
+_log_error = logger.error
+
+# pyodbc is optional, so its Error is only caught when it could be imported.
+_DB_ERRORS = (dbapi.Error,) + ((pyodbc.Error,) if 'pyodbc' in globals() else ())
+
+_OUTPUTS = {'dataframe': 'dataframe', 'numpy': 'numpy', 'pandas': 'pandas'}
+_EXECUTES = {'server': 'server', 'client': 'client', 'auto': 'auto'}
+# The single-distribution samplers can also return a lazy RAND() view.
+_SAMPLER_EXECUTES = dict(_EXECUTES, view='view')
+
+_Param = collections.namedtuple('_Param', ['name', 'pal_name', 'type', 'check', 'msg', 'required',
+                                           'truncate'])
+
+def _param(name, pal_name, ptype, check=None, msg=None, required=True,#pylint: disable=too-many-arguments
+           truncate=False):
+    return _Param(name, pal_name, ptype, check, msg, required, truncate)
+
+def _positive(value):
+    return value > 0
+
+def _non_negative(value):
+    return value >= 0
+
+def _fraction(value):
+    return 0 <= value <= 1
+
+_P_RANGE_MSG = 'Parameter p should be in the range of 0 and 1.'
+_SHAPE_SCALE_MSG = 'Parameters shape and scale should be greater than zero.'
+_SCALE_MSG = 'Parameter scale should be greater than zero.'
+_NUM_RANDOM_MSG = 'Parameter num_random should be greater than or equal to zero.'
+_SIGMA_VARIANCE_MSG = ('Parameters variance and sigma cannot be used together. ' +
+                       'Please choose one from them.')
+_SIGMA_MSG = 'Parameter sigma should be greater than zero.'
+_VARIANCE_MSG = 'Parameter variance should be greater than zero.'
+_PERT_ORDER_MSG = ('minimum should be less than or equal to mode, ' +
+                   'and mode should be less than or equal to maximum.')
+_UNIFORM_RANGE_MSG = 'Value of low should be lower than high.'
+_NUM_CHAINS_MSG = 'Parameter num_chains should be greater than zero.'
+_PARAM_GRID_MSG = ('Parameter param_grid should be a non-empty list of dicts of mcmc ' +
+                   'arguments, each including distribution.')
+_PARAM_GRID_DIM_MSG = 'All parameter sets of param_grid should have the same dimension.'
+_VIEW_SEED_MSG = "Parameter seed cannot be used with execute='view'."
+_PVALS_MSG = 'Parameter pvals should be a tuple of non-negative floats and ints.'
+_PVALS_SUM_MSG = 'Parameter pvals should have at least one value greater than zero.'
+
+def _as_float(name, value):
+    """
+    arg(name, value, float), skipping the generic checks for None and floats.
+    """
+    if value is None or type(value) is float:#pylint: disable=unidiomatic-typecheck
+        return value
+    return arg(name, value, float)
 
-def _rds(conn_context, dist_params, num_random, seed, thread_ratio):#pylint: disable=too-many-locals
-    require_pal_usable(conn_context)
-    num_random = arg('num_random', num_random, int)
-    seed = arg('seed', seed, int)
-    thread_ratio = arg('thread_ratio', thread_ratio, float)
-    if num_random < 0:
-        msg = 'Parameter num_random should be greater than or equal to zero.'
-        logger.error(msg)
+def _as_int(name, value):
+    """
+    arg(name, value, int), skipping the generic checks for None and ints.
+    """
+    if value is None or type(value) is int:#pylint: disable=unidiomatic-typecheck
+        return value
+    return arg(name, value, int)
+
+# Sampler arguments per PAL distribution, in the order their rows are sent to PAL.
+_SCHEMAS = {
+    'BERNOULLI': (_param('p', 'SUCCESS_FRACTION', float, _fraction, _P_RANGE_MSG),),
+    'BETA': (_param('a', 'SHAPE1', float, _positive,
+                    'Parameters a and b should be greater than zero.'),
+             _param('b', 'SHAPE2', float, _positive,
+                    'Parameters a and b should be greater than zero.')),
+    'BINOMIAL': (_param('p', 'SUCCESS_FRACTION', float, _fraction, _P_RANGE_MSG),
+                 _param('n', 'TRIALS', int, _non_negative, 'Parameter n should be at least zero.')),
+    'CAUCHY': (_param('location', 'LOCATION', float),
+               _param('scale', 'SCALE', float, _positive, _SCALE_MSG)),
+    'CHI_SQUARED': (_param('dof', 'DEGREES_OF_FREEDOM', int, _positive,
+                           'Parameter dof should be greater than zero.'),),
+    'EXPONENTIAL': (_param('lamb', 'RATE', float, _positive,
+                           'Parameter lamb should be greater than zero.'),),
+    'EXTREME_VALUE': (_param('location', 'LOCATION', float),
+                      _param('scale', 'SCALE', float, _positive, _SCALE_MSG)),
+    'FISHER_F': (_param('dof1', 'DEGREES_OF_FREEDOM1', float, _positive,
+                        'Parameters dof1 and dof2 should be positive.'),
+                 _param('dof2', 'DEGREES_OF_FREEDOM2', float, _positive,
+                        'Parameters dof1 and dof2 should be positive.')),
+    'GAMMA': (_param('shape', 'SHAPE', float, _positive, _SHAPE_SCALE_MSG),
+              _param('scale', 'SCALE', float, _positive, _SHAPE_SCALE_MSG)),
+    'GEOMETRIC': (_param('p', 'SUCCESS_FRACTION', float, _fraction, _P_RANGE_MSG),),
+    'LOGNORMAL': (_param('mean', 'LOCATION', float),
+                  _param('sigma', 'SCALE', float, _positive,
+                         'Parameter sigma should be greater than zero.')),
+    'NEGATIVE_BINOMIAL': (_param('n', 'SUCCESSES', int, _positive,
+                                 'Parameter n should be greater than zero.', truncate=True),
+                          _param('p', 'SUCCESS_FRACTION', float, _fraction, _P_RANGE_MSG)),
+    'NORMAL': (_param('mean', 'MEAN', float),
+               _param('variance', 'VARIANCE', float, required=False),
+               _param('sigma', 'SD', float, required=False)),
+    'PERT': (_param('minimum', 'MIN', float),
+             _param('mode', 'MODE', float),
+             _param('maximum', 'MAX', float),
+             _param('scale', 'SCALE', float)),
+    'POISSON': (_param('theta', 'THETA', float, _positive,
+                       'Parameter theta should be greater than zero.'),),
+    'STUDENT_T': (_param('dof', 'DEGREES_OF_FREEDOM', float, _positive,
+                         'Parameter dof should be greater than zero.'),),
+    'UNIFORM': (_param('low', 'MIN', float),
+                _param('high', 'MAX', float)),
+    'WEIBULL': (_param('shape', 'SHAPE', float, _positive, _SHAPE_SCALE_MSG),
+                _param('scale', 'SCALE', float, _positive, _SHAPE_SCALE_MSG)),
+}
+
+def _resolve_scale(sigma, variance, default_sigma=1.0):
+    """
+    Return the (sigma, variance) of a normal distribution, with `sigma` set
+    to `default_sigma` if neither is given.
+
+    At most one of them may be given, and it must be positive.
+    """
+    if variance is None:
+        if sigma is None:
+            return default_sigma, None
+        value, msg = sigma, _SIGMA_MSG
+    elif sigma is None:
+        value, msg = variance, _VARIANCE_MSG
+    else:
+        _log_error(_SIGMA_VARIANCE_MSG)
+        raise ValueError(_SIGMA_VARIANCE_MSG)
+    if value <= 0:
+        _log_error(msg)
         raise ValueError(msg)
-    unique_id = str(uuid.uuid1()).replace('-', '_').upper()
-    dist_name = dict(dist_params)['DISTRIBUTIONNAME']
-    tables = ['#{}_{}_{}'.format(dist_name, tbl_name, unique_id) for tbl_name in
-              ['DISTRIBUTION_PARAMETER', 'PARAMETER', 'RESULT']]
-    dist_param_tbl, general_param_tbl, res_tbl = tables
-    dist_param_spec = [('NAME', NVARCHAR(100)), ('VALUE', NVARCHAR(100))]
-    general_params = [('NUM_RANDOM', num_random, None, None),
-                      ('SEED', seed, None, None),
-                      ('THREAD_RATIO', None, thread_ratio, None)]
+    return sigma, variance
+
+def _check_normal(mean, variance, sigma):#pylint: disable=unused-argument
+    _resolve_scale(sigma, variance)
+
+def _check_pert(minimum, mode, maximum, scale):#pylint: disable=unused-argument
+    # MIN < MODE < MAX
+    if not minimum <= mode <= maximum:
+        _log_error(_PERT_ORDER_MSG)
+        raise ValueError(_PERT_ORDER_MSG)
 
+def _check_uniform(low, high):
+    if low >= high:
+        _log_error(_UNIFORM_RANGE_MSG)
+        raise ValueError(_UNIFORM_RANGE_MSG)
+
+# Checks across the arguments of one distribution, called with the validated values.
+_CROSS_CHECKS = {
+    'NORMAL': _check_normal,
+    'PERT': _check_pert,
+    'UNIFORM': _check_uniform,
+}
+
+def _validate(dist_name, *values):
+    """
+    Check sampler arguments against the schema of `dist_name`.
+
+    Values of exactly the expected type skip the generic arg() check.
+    Results are memoized, so repeated draws with the same arguments reuse
+    the same immutable rows; invalid arguments raise on every call.
+
+    Returns
+    -------
+    tuple of tuple
+        PAL distribution parameter rows, starting with DISTRIBUTIONNAME.
+    """
     try:
-        create(conn_context, Table(dist_param_tbl, dist_param_spec).with_data(dist_params))
-        call_pal_auto_with_hint(conn_context,
-                                None, 'PAL_DISTRIBUTION_RANDOM', conn_context.table(dist_param_tbl),
-                                ParameterTable(general_param_tbl).with_data(general_params),
-                                res_tbl)
-    except dbapi.Error as db_err:
+        hash(values)
+    except TypeError:
+        # Unhashable values such as lists cannot be memoized, and are left
+        # to arg() to reject with its usual message.
+        return _check_dist_params(dist_name, values)
+    return _validate_memoized(dist_name, *values)
+
+# Keyed by type as well as value, so that e.g. 2.0 is not accepted where 2 was.
+@functools.lru_cache(maxsize=1024, typed=True)
+def _validate_memoized(dist_name, *values):
+    return _check_dist_params(dist_name, values)
+
+def _check_dist_params(dist_name, values):
+    dist_params = [('DISTRIBUTIONNAME', dist_name)]
+    for param, value in zip(_SCHEMAS[dist_name], values):
+        if param.truncate and isinstance(value, float):
+            value = int(value)
+        if type(value) is not param.type:#pylint: disable=unidiomatic-typecheck
+            value = arg(param.name, value, param.type, param.required)
+        if param.check is not None and value is not None and not param.check(value):
+            _log_error(param.msg)
+            raise ValueError(param.msg)
+        dist_params.append((param.pal_name, value))
+    cross_check = _CROSS_CHECKS.get(dist_name)
+    if cross_check is not None:
+        cross_check(*[value for _, value in dist_params[1:]])
+    return tuple(dist_params)
+
+class _ScratchPool(object):#pylint: disable=useless-object-inheritance
+    """
+    Per-connection pool of local temporary tables holding distribution parameters.
+
+    Tables are keyed by their layout and reused through TRUNCATE, instead of
+    creating a new table for every sampling call. Local temporary tables go
+    away with the session, so nothing needs to be dropped when the
+    connection is closed.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._free = {}
+        self._count = 0
+
+    def acquire(self, conn_context, key, spec, data):
+        """
+        Return the name of a table with layout `spec`, filled with `data`.
+
+        If the table cannot be created or filled, it is dropped rather than
+        handed back to the pool, and the database error is raised.
+        """
+        with self._lock:
+            free = self._free.get(key)
+            name = free.pop() if free else None
+            if name is None:
+                self._count += 1
+                slot = self._count
+        try:
+            if name is None:
+                name = '#PAL_RND_{}_{}'.format(key, slot)
+                create(conn_context, Table(name, spec).with_data(data), force=False)
+                return name
+            with conn_context.connection.cursor() as cur:
+                execute_logged(cur, 'TRUNCATE TABLE {}'.format(quotename(name)),
+                               conn_context.sql_tracer, conn_context)
+                statement = sql_for_insert_values(name, data)
+                # SQLTRACE
+                conn_context.sql_tracer.trace_sql_many(statement, data)
+                cur.executemany(statement, data)
+        except _DB_ERRORS:
+            try_drop(conn_context, name)
+            raise
+        return name
+
+    def release(self, key, name):
+        """
+        Hand a table obtained from acquire back to the pool.
+        """
+        with self._lock:
+            self._free.setdefault(key, []).append(name)
+
+def _scratch_pool(conn_context):
+    # pylint: disable=protected-access
+    pool = getattr(conn_context, '_random_scratch_pool', None)
+    if pool is None:
+        pool = conn_context._random_scratch_pool = _ScratchPool()
+    return pool
+
+_FETCH_SIZE = 65536
+
+# Largest draw, in bytes of float64 samples, that execute='auto' generates locally.
+_CLIENT_MAX_BYTES = 1 << 20
+
+def _normal_scale(params):
+    sigma, variance = _resolve_scale(params['SD'], params['VARIANCE'])
+    return sigma if variance is None else np.sqrt(variance)
+
+def _pert(rng, params, size):
+    low, mode, high = params['MIN'], params['MODE'], params['MAX']
+    if low == high:
+        return np.full(size, float(low))
+    span = high - low
+    alpha = 1 + params['SCALE'] * (mode - low) / span
+    beta_ = 1 + params['SCALE'] * (high - mode) / span
+    return low + span * rng.beta(alpha, beta_, size)
+
+# NumPy equivalents of PAL_DISTRIBUTION_RANDOM, called as sampler(rng, params, size)
+# with `params` mapping PAL parameter names to values.
+_CLIENT_SAMPLERS = {
+    'BERNOULLI': lambda rng, prm, size: rng.binomial(1, prm['SUCCESS_FRACTION'], size),
+    'BETA': lambda rng, prm, size: rng.beta(prm['SHAPE1'], prm['SHAPE2'], size),
+    'BINOMIAL': lambda rng, prm, size: rng.binomial(prm['TRIALS'], prm['SUCCESS_FRACTION'],
+                                                    size),
+    'CAUCHY': lambda rng, prm, size: (prm['LOCATION'] +
+                                      prm['SCALE'] * rng.standard_cauchy(size)),
+    'CHI_SQUARED': lambda rng, prm, size: rng.chisquare(prm['DEGREES_OF_FREEDOM'], size),
+    'EXPONENTIAL': lambda rng, prm, size: rng.exponential(1.0 / prm['RATE'], size),
+    'EXTREME_VALUE': lambda rng, prm, size: rng.gumbel(prm['LOCATION'], prm['SCALE'], size),
+    'FISHER_F': lambda rng, prm, size: rng.f(prm['DEGREES_OF_FREEDOM1'],
+                                             prm['DEGREES_OF_FREEDOM2'], size),
+    'GAMMA': lambda rng, prm, size: rng.gamma(prm['SHAPE'], prm['SCALE'], size),
+    # PAL counts the failures before the first success, NumPy the trials.
+    'GEOMETRIC': lambda rng, prm, size: rng.geometric(prm['SUCCESS_FRACTION'], size) - 1,
+    'LOGNORMAL': lambda rng, prm, size: rng.lognormal(prm['LOCATION'], prm['SCALE'], size),
+    'NEGATIVE_BINOMIAL': lambda rng, prm, size: rng.negative_binomial(
+        prm['SUCCESSES'], prm['SUCCESS_FRACTION'], size),
+    'NORMAL': lambda rng, prm, size: rng.normal(prm['MEAN'], _normal_scale(prm), size),
+    'PERT': _pert,
+    'POISSON': lambda rng, prm, size: rng.poisson(prm['THETA'], size),
+    'STUDENT_T': lambda rng, prm, size: rng.standard_t(prm['DEGREES_OF_FREEDOM'], size),
+    'UNIFORM': lambda rng, prm, size: rng.uniform(prm['MIN'], prm['MAX'], size),
+    'WEIBULL': lambda rng, prm, size: prm['SCALE'] * rng.weibull(prm['SHAPE'], size),
+}
+
+# Size from which client-side draws use the parallel numba kernels, if usable.
+_KERNEL_MIN_SIZE = 10**6
+
+# Numba kernels replacing _CLIENT_SAMPLERS for large draws, called as
+# sampler(kernels, seed, params, size) with the module returned by _kernels().
+_KERNEL_SAMPLERS = {
+    'GAMMA': lambda kernels, seed, prm, size: kernels.gamma(
+        seed, size, float(prm['SHAPE']), float(prm['SCALE'])),
+    'NORMAL': lambda kernels, seed, prm, size: kernels.normal(
+        seed, size, float(prm['MEAN']), float(_normal_scale(prm))),
+    'POISSON': lambda kernels, seed, prm, size: kernels.poisson(
+        seed, size, float(prm['THETA'])),
+    'UNIFORM': lambda kernels, seed, prm, size: kernels.uniform(
+        seed, size, float(prm['MIN']), float(prm['MAX'])),
+}
+
+@functools.lru_cache(maxsize=1)
+def _kernels():
+    """
+    Return the _rng_kernels module if its kernels can be used, or None.
+
+    It is imported on the first large draw only, as importing numba takes a
+    noticeable time. The kernels are only used when numba is installed and
+    runs on more than one thread, since on a single thread NumPy is faster.
+    """
+    from hana_ml.algorithms.pal import _rng_kernels#pylint: disable=import-outside-toplevel
+    if _rng_kernels.AVAILABLE and _rng_kernels.NUM_THREADS > 1:
+        return _rng_kernels
+    return None
+
+def _sql_num(value):
+    return '(' + sqlgen.literal(float(value)) + ')'
+
+def _sql_normal(mean, sd):
+    # Box-Muller transform of two RAND() draws, 1 - RAND() keeping LN() finite.
+    return '{} + {} * SQRT(-2 * LN(1 - RAND())) * COS({} * RAND())'.format(
+        _sql_num(mean), _sql_num(sd), _sql_num(2 * np.pi))
+
+# SQL expressions drawing one sample of PAL_DISTRIBUTION_RANDOM from RAND(), for the
+# distributions with a closed-form transform, called as sampler(params).
+_VIEW_SAMPLERS = {
+    'BERNOULLI': lambda prm: 'CASE WHEN RAND() < {} THEN 1 ELSE 0 END'.format(
+        _sql_num(prm['SUCCESS_FRACTION'])),
+    'CAUCHY': lambda prm: '{} + {} * TAN({} * (RAND() - 0.5))'.format(
+        _sql_num(prm['LOCATION']), _sql_num(prm['SCALE']), _sql_num(np.pi)),
+    'EXPONENTIAL': lambda prm: '-LN(1 - RAND()) / {}'.format(_sql_num(prm['RATE'])),
+    'EXTREME_VALUE': lambda prm: '{} - {} * LN(-LN(1 - RAND()))'.format(
+        _sql_num(prm['LOCATION']), _sql_num(prm['SCALE'])),
+    'LOGNORMAL': lambda prm: 'EXP({})'.format(_sql_normal(prm['LOCATION'], prm['SCALE'])),
+    'NORMAL': lambda prm: _sql_normal(prm['MEAN'], _normal_scale(prm)),
+    'UNIFORM': lambda prm: '{0} + ({1} - {0}) * RAND()'.format(_sql_num(prm['MIN']),
+                                                               _sql_num(prm['MAX'])),
+    'WEIBULL': lambda prm: '{} * POWER(-LN(1 - RAND()), 1 / {})'.format(
+        _sql_num(prm['SCALE']), _sql_num(prm['SHAPE'])),
+}
+
+_VIEW_SQL = ('SELECT CAST("GENERATED_PERIOD_START" AS INTEGER) AS "ID", '
+             'CAST({} AS DOUBLE) AS "GENERATED_NUMBER" '
+             'FROM SERIES_GENERATE_INTEGER(1, 0, {})')
+# SERIES_GENERATE_INTEGER() rejects an empty range, so no samples are drawn
+# by filtering out the one row of SERIES_GENERATE_INTEGER(1, 0, 1).
+_VIEW_EMPTY_FILTER = ' WHERE 1 = 0'
+
+_MASK64 = (1 << 64) - 1
+_SPLITMIX_GAMMA = 0x9E3779B97F4A7C15
+# Draws reserved for each stream of seed_stream before it runs into the next.
+_STREAM_STRIDE = 1 << 40
+
+_seed_streams = threading.local()
+
+def _splitmix64(state):
+    state = (state ^ (state >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    state = (state ^ (state >> 27)) * 0x94D049BB133111EB & _MASK64
+    return state ^ (state >> 31)
+
+def seed_stream(base_seed=None, stream=0):
+    """
+    Make the sampling calls of the current thread that pass no `seed` take
+    their seeds from a reproducible sequence.
+
+    The sequence is a SplitMix64 generator started at `base_seed` and moved
+    ahead by 2**40 draws per `stream`. Threads that use the same `base_seed`
+    and distinct `stream` numbers therefore get independent, non-overlapping
+    seed sequences, and rerunning them reproduces the same samples.
+
+    Parameters
+    ----------
+
+    base_seed : int, optional
+
+        Starting point of the seed sequence. If not provided, calls without a
+        `seed` go back to drawing it from ``os.urandom``.
+
+    stream : int, optional
+
+        Index of the sequence of this thread, e.g. a worker number.
+
+        Defaults to 0.
+
+    Examples
+    --------
+
+    >>> def worker(i):
+    ...     seed_stream(base_seed=2021, stream=i)
+    ...     return normal(conn_context=cc, num_random=10, output='numpy')
+    """
+    base_seed = _as_int('base_seed', base_seed)
+    stream = arg('stream', stream, int)
+    if base_seed is None:
+        _seed_streams.state = None
+        return
+    _seed_streams.state = (base_seed + stream * _STREAM_STRIDE * _SPLITMIX_GAMMA) & _MASK64
+
+def _resolve_seed(seed):
+    """
+    Replace a missing or zero `seed` with a positive 31-bit seed, so that the
+    seed of every draw is known and can be recorded on its result.
+
+    The seed comes from the thread's seed_stream() if one is set, from
+    os.urandom otherwise.
+    """
+    if seed:
+        return seed
+    state = getattr(_seed_streams, 'state', None)
+    if state is None:
+        return int.from_bytes(os.urandom(4), 'little') & 0x7FFFFFFF or 1
+    state = _seed_streams.state = (state + _SPLITMIX_GAMMA) & _MASK64
+    return _splitmix64(state) >> 33 or 1
+
+def _rds_client(conn_context, dist_params, num_random, seed, output):
+    """
+    Draw the samples of _rds() locally with NumPy instead of calling PAL,
+    or with the numba kernels for large draws when they can be used.
+    """
+    params = dict(dist_params)
+    dist_name = params['DISTRIBUTIONNAME']
+    kernels = None
+    if num_random >= _KERNEL_MIN_SIZE and dist_name in _KERNEL_SAMPLERS:
+        kernels = _kernels()
+    if kernels is not None:
+        samples = _KERNEL_SAMPLERS[dist_name](kernels, seed, params, num_random)
+    else:
+        rng = np.random.default_rng(seed)
+        samples = _CLIENT_SAMPLERS[dist_name](rng, params, num_random)
+        samples = samples.astype(np.float64)
+    if output == 'numpy':
+        return samples
+    if output == 'pandas':
+        res = _samples_frame(samples, ['GENERATED_NUMBER'])
+        res.attrs['seed'] = seed
+        return res
+    res = _upload_samples(conn_context, params['DISTRIBUTIONNAME'], samples,
+                          ['GENERATED_NUMBER'])
+    res.seed = seed
+    return res
+
+def _rds_view(conn_context, dist_params, num_random, seed, output):
+    """
+    Return the samples of _rds() as a DataFrame over a SELECT drawing them
+    with RAND(), without calling PAL or creating a table. SAP HANA evaluates
+    it only when the DataFrame, or a statement built on it, is executed.
+    """
+    params = dict(dist_params)
+    dist_name = params['DISTRIBUTIONNAME']
+    if dist_name not in _VIEW_SAMPLERS:
+        msg = "execute='view' is not supported for the {} distribution.".format(
+            dist_name.lower())
+        _log_error(msg)
+        raise ValueError(msg)
+    if seed:
+        _log_error(_VIEW_SEED_MSG)
+        raise ValueError(_VIEW_SEED_MSG)
+    sql = _VIEW_SQL.format(_VIEW_SAMPLERS[dist_name](params), max(num_random, 1))
+    if num_random == 0:
+        sql += _VIEW_EMPTY_FILTER
+    res = conn_context.sql(sql)
+    if output == 'dataframe':
+        return res
+    res = res.collect()
+    return res if output == 'pandas' else res['GENERATED_NUMBER'].to_numpy(np.float64)
+
+def _result_table(dist_name):
+    return '#' + dist_name + '_RESULT_' + uuid.uuid4().hex.upper()
+
+def _samples_frame(samples, columns):
+    """
+    Return `samples` as a pandas DataFrame with an INTEGER-like ID column
+    followed by `columns`, matching the layout of the PAL result table.
+    """
+    res = pd.DataFrame(samples.reshape(len(samples), len(columns)), columns=columns)
+    res.insert(0, 'ID', np.arange(len(samples), dtype=np.int32))
+    return res
+
+def _upload_samples(conn_context, dist_name, samples, columns):
+    """
+    Upload client-side `samples` into a local temporary table with an ID
+    column followed by DOUBLE `columns`, and return it as a DataFrame.
+    """
+    res_tbl = _result_table(dist_name)
+    res = _samples_frame(samples, columns)
+    table_structure = dict.fromkeys(columns, 'DOUBLE')
+    table_structure['ID'] = 'INTEGER'
+    return create_dataframe_from_pandas(conn_context, res, res_tbl,
+                                        table_structure=table_structure,
+                                        disable_progressbar=True)
+
+@functools.lru_cache(maxsize=32)
+def _build_alias(pvals):
+    """
+    Build the Vose alias table of the category weights `pvals`, a tuple.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Acceptance probability and alias of every category.
+    """
+    k = len(pvals)
+    scaled = np.asarray(pvals, dtype=np.float64)
+    scaled = scaled * (k / scaled.sum())
+    prob = np.ones(k)
+    alias = np.arange(k)
+    small = [i for i in range(k) if scaled[i] < 1]
+    large = [i for i in range(k) if scaled[i] >= 1]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        prob[less] = scaled[less]
+        alias[less] = more
+        scaled[more] += scaled[less] - 1
+        if scaled[more] < 1:
+            small.append(more)
+        else:
+            large.append(more)
+    prob.setflags(write=False)
+    alias.setflags(write=False)
+    return prob, alias
+
+def _multinomial_alias(rng, n, pvals, size):
+    """
+    Draw `size` multinomial samples of `n` trials each from the cached alias
+    table of `pvals`, at O(1) per trial regardless of the number of categories.
+    """
+    prob, alias = _build_alias(pvals)
+    k = len(pvals)
+    draws = rng.random((size, n)) * k
+    cols = draws.astype(np.intp)
+    cats = np.where(draws - cols < prob[cols], cols, alias[cols])
+    cats += k * np.arange(size)[:, None]
+    return np.bincount(cats.ravel(), minlength=size * k).reshape(size, k)
+
+def _rds(conn_context, dist_params, num_random, seed, thread_ratio,#pylint: disable=too-many-arguments
+         output='dataframe', execute='server'):
+    execute = arg('execute', execute, _SAMPLER_EXECUTES)
+    if execute != 'server':
+        num_random = _as_int('num_random', num_random)
+        output = arg('output', output, _OUTPUTS)
+        if num_random < 0:
+            _log_error(_NUM_RANDOM_MSG)
+            raise ValueError(_NUM_RANDOM_MSG)
+        if execute == 'view':
+            return _rds_view(conn_context, dist_params, num_random, _as_int('seed', seed),
+                             output)
+        seed = _resolve_seed(_as_int('seed', seed))
+        if execute == 'client' or (output != 'dataframe' and
+                                   num_random * 8 <= _CLIENT_MAX_BYTES):
+            return _rds_client(conn_context, dist_params, num_random, seed, output)
+    dist_name = dist_params[0][1]  # _validate() puts DISTRIBUTIONNAME first
+    return _rds_many(conn_context, dist_name, [dist_params], num_random, seed,
+                     thread_ratio, with_spec_id=False, output=output)
+
+def _fetch_numpy(conn_context, cur, num_rows, num_cols=1):
+    """
+    Fetch the pending result set of `cur` into a float64 array of shape
+    (num_rows, num_cols), in chunks of _FETCH_SIZE rows.
+    """
+    if not conn_context.pyodbc_connection:
+        cur.setfetchsize(_FETCH_SIZE)
+    values = np.empty((num_rows, num_cols), dtype=np.float64)
+    pos = 0
+    rows = cur.fetchmany(_FETCH_SIZE)
+    while rows:
+        if num_cols == 1:
+            # Copy the values straight out of the rows instead of building
+            # a tuple per row first.
+            values[pos:pos + len(rows), 0] = np.fromiter(
+                (row[0] for row in rows), dtype=np.float64, count=len(rows))
+        else:
+            values[pos:pos + len(rows)] = [tuple(row) for row in rows]
+        pos += len(rows)
+        rows = cur.fetchmany(_FETCH_SIZE)
+    return values[:pos]
+
+def _dist_params_sql(spec_id, dist_params):
+    """
+    Return a statement assigning the (NAME, VALUE) rows of `dist_params` to
+    the table variable dist_<spec_id>.
+    """
+    rows = ['{} AS "NAME", {} AS "VALUE"'.format(
+        'CAST({} AS NVARCHAR(100))'.format(sqlgen.literal(dist_params[0][0])),
+        'CAST({} AS NVARCHAR(100))'.format(sqlgen.literal(dist_params[0][1])))]
+    rows.extend('{}, {}'.format(sqlgen.literal(name),
+                                sqlgen.literal(None if value is None else str(value)))
+                for name, value in dist_params[1:])
+    return 'dist_{} = {};\n'.format(
+        spec_id, ' UNION ALL '.join('SELECT ' + row + ' FROM DUMMY' for row in rows))
+
+@functools.lru_cache(maxsize=64)
+def _outputs_select(num_specs, with_spec_id):
+    """
+    Return the query over the PAL outputs out_0 .. out_<num_specs - 1> of an
+    _rds_sql block, tagging each row with its SPEC_ID if `with_spec_id`.
+    """
+    if not with_spec_id:
+        return 'SELECT * FROM :out_0'
+    return ' UNION ALL '.join(
+        'SELECT {0} AS "SPEC_ID", "ID", "GENERATED_NUMBER" FROM :out_{0}'.format(i)
+        for i in range(num_specs))
+
+def _rds_sql(specs, general_params, res_tbl, with_spec_id, fetch_columns='"GENERATED_NUMBER"'):
+    """
+    Return an anonymous block running PAL_DISTRIBUTION_RANDOM once per
+    distribution in `specs` and collecting all samples in `res_tbl`.
+
+    The distribution parameters are inlined as table variables, so the
+    whole call is a single statement.
+
+    If `res_tbl` is None, the block instead ends with a SELECT of
+    `fetch_columns`, ordered by distribution and ID, so the samples can be
+    fetched directly.
+    """
+    invocations = ''.join(
+        _dist_params_sql(i, dist_params) +
+        'CALL _SYS_AFL.PAL_DISTRIBUTION_RANDOM(:dist_{0}, :params, out_{0});\n'.format(i)
+        for i, dist_params in enumerate(specs))
+    if res_tbl is None:
+        extract_output = 'SELECT {} FROM ({}) ORDER BY "SPEC_ID", "ID";\n'.format(
+            fetch_columns, _outputs_select(len(specs), True))
+    else:
+        extract_output = 'CREATE LOCAL TEMPORARY COLUMN TABLE {} AS ({});\n'.format(
+            quotename(res_tbl), _outputs_select(len(specs), with_spec_id))
+    return ('DO\nBEGIN\n'
+            + sqlgen.create_params(general_params)
+            + invocations
+            + extract_output
+            + 'END\n')
+
+def _rds_many(conn_context, dist_name, specs, num_random, seed, thread_ratio,#pylint: disable=too-many-arguments, too-many-locals
+              with_spec_id=True, output='dataframe'):
+    require_pal_usable(conn_context)
+    num_random = _as_int('num_random', num_random)
+    seed = _resolve_seed(_as_int('seed', seed))
+    thread_ratio = _as_float('thread_ratio', thread_ratio)
+    output = arg('output', output, _OUTPUTS)
+    if num_random < 0:
+        _log_error(_NUM_RANDOM_MSG)
+        raise ValueError(_NUM_RANDOM_MSG)
+    res_tbl = _result_table(dist_name)
+    # The parameters are inlined into the anonymous block, so only the rows
+    # ParameterTable.with_data would keep are built.
+    general_params = [('NUM_RANDOM', num_random, None, None)]
+    if seed is not None:
+        general_params.append(('SEED', seed, None, None))
+    if thread_ratio is not None:
+        general_params.append(('THREAD_RATIO', None, thread_ratio, None))
+
+    columns = (['SPEC_ID'] if with_spec_id else []) + ['ID', 'GENERATED_NUMBER']
+    if output == 'pandas':
+        sql = _rds_sql(specs, general_params, None, with_spec_id,
+                       ', '.join(quotename(col) for col in columns))
+    else:
+        sql = _rds_sql(specs, general_params, res_tbl if output == 'dataframe' else None,
+                       with_spec_id)
+    try:
+        # SQLTRACE
+        conn_context.sql_tracer.trace_object({
+            'name':'PAL_DISTRIBUTION_RANDOM',
+            'schema': '_SYS_AFL',
+            'type': 'pal'
+        }, sub_cat='function')
+        with conn_context.connection.cursor() as cur:
+            execute_logged(cur, sql, conn_context.sql_tracer, conn_context)
+            if output == 'numpy':
+                samples = _fetch_numpy(conn_context, cur, len(specs) * num_random)
+            elif output == 'pandas':
+                samples = _fetch_numpy(conn_context, cur, len(specs) * num_random,
+                                       len(columns))
+    except _DB_ERRORS as db_err:
         logger.exception(str(db_err))
-        try_drop(conn_context, tables)
+        try_drop(conn_context, res_tbl)
         raise
-    except pyodbc.Error as db_err:
-        logger.exception(str(db_err.args[1]))
-        try_drop(conn_context, tables)
-        raise
-    return conn_context.table(res_tbl)
+    if output == 'numpy':
+        return samples.reshape((len(specs), -1) if with_spec_id else -1)
+    if output == 'pandas':
+        res = pd.DataFrame(samples, columns=columns)
+        res = res.astype({col: np.int32 for col in columns[:-1]})
+        res.attrs['seed'] = seed
+        return res
+    res = conn_context.table(res_tbl)
+    res.seed = seed
+    return res
+
+# Public sampler name of every distribution in _SCHEMAS, for batch_random.
+_SAMPLER_DISTRIBUTIONS = {
+    'bernoulli': 'BERNOULLI',
+    'beta': 'BETA',
+    'binomial': 'BINOMIAL',
+    'cauchy': 'CAUCHY',
+    'chi_squared': 'CHI_SQUARED',
+    'exponential': 'EXPONENTIAL',
+    'gumbel': 'EXTREME_VALUE',
+    'f': 'FISHER_F',
+    'gamma': 'GAMMA',
+    'geometric': 'GEOMETRIC',
+    'lognormal': 'LOGNORMAL',
+    'negative_binomial': 'NEGATIVE_BINOMIAL',
+    'normal': 'NORMAL',
+    'pert': 'PERT',
+    'poisson': 'POISSON',
+    'student_t': 'STUDENT_T',
+    'uniform': 'UNIFORM',
+    'weibull': 'WEIBULL',
+}
+_BATCH_SPECS_MSG = ('Parameter specs should be a non-empty list of (sampler, kwargs) ' +
+                    'pairs, with sampler one of {}.'.format(sorted(_SAMPLER_DISTRIBUTIONS)))
+
+@functools.lru_cache(maxsize=None)
+def _sampler_defaults(sampler):
+    """
+    Default values of the distribution arguments of the public `sampler`.
+    """
+    parameters = inspect.signature(globals()[sampler]).parameters
+    return {param.name: parameters[param.name].default
+            for param in _SCHEMAS[_SAMPLER_DISTRIBUTIONS[sampler]]}
+
+def batch_random(conn_context, specs, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+                 output='dataframe'):
+    """
+    Draw samples from several distributions, named like their sampler
+    functions, with a single PAL invocation.
+
+    All distributions are sampled in one anonymous block that carries their
+    parameters inline, so drawing from N distributions costs one round-trip
+    instead of N. Each distribution is validated exactly as its sampler
+    function would do.
+
+    Parameters
+    ----------
+
+    conn_context : ConnectionContext
+
+        Database connection object.
+
+    specs : list of tuple
+
+        One (sampler, kwargs) pair per distribution, where `sampler` is the
+        name of a sampler function of this module, e.g. 'normal', and `kwargs`
+        is a dict of its distribution arguments. Arguments left out take the
+        defaults of the sampler function.
+
+    num_random : int, optional
+
+        Specifies the number of random data to be generated for each
+        distribution.
+
+        Defaults to 100.
+
+    seed : int, optional
+
+        Indicates the seed used to initialize the random number generator:
+
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
+          - Not 0: Uses the specified seed.
+
+        Defaults to 0.
+
+    thread_ratio : float, optional
+
+        Controls the proportion of available threads to use.
+
+        Defaults to 0.
+
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a numpy.ndarray of shape (len(specs), num_random), row i
+            holding the sample values of the i-th distribution ordered by ID.
+            The samples are fetched in the same round-trip that generates them
+            and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'.
+
+        Defaults to 'dataframe'.
+
+    Returns
+    -------
+
+    DataFrame, pandas.DataFrame or numpy.ndarray
+
+        Dataframe containing the generated random samples,
+        structured as follows:
+
+          - SPEC_ID, type INTEGER, position of the distribution in `specs`,
+            starting from 0.
+          - ID, type INTEGER, ID column.
+          - GENERATED_NUMBER, type DOUBLE, sample value.
+
+    Examples
+    --------
+
+    Draw samples from a normal, a gamma and a poisson distribution at once.
+
+    >>> res = batch_random(conn_context=cc,
+    ...                    specs=[('normal', {'mean': 0, 'sigma': 1}),
+    ...                           ('gamma', {'shape': 2}),
+    ...                           ('poisson', {'theta': 4.0})],
+    ...                    num_random=2)
+    >>> res.collect()
+       SPEC_ID  ID  GENERATED_NUMBER
+    0        0   0          0.321078
+    1        0   1         -1.327626
+    2        1   0          1.524325
+    3        1   1          2.838907
+    4        2   0          3.000000
+    5        2   1          6.000000
+    """
+    specs = arg('specs', specs, list, True)
+    if not specs or any(not isinstance(spec, (list, tuple)) or len(spec) != 2 or
+                        not isinstance(spec[0], str) or spec[0] not in _SAMPLER_DISTRIBUTIONS or
+                        not isinstance(spec[1], dict) for spec in specs):
+        _log_error(_BATCH_SPECS_MSG)
+        raise ValueError(_BATCH_SPECS_MSG)
+    dist_specs = []
+    for sampler, kwargs in specs:
+        defaults = _sampler_defaults(sampler)
+        unknown = sorted(set(kwargs) - set(defaults))
+        if unknown:
+            msg = '{}() got unexpected distribution arguments {}.'.format(sampler, unknown)
+            _log_error(msg)
+            raise TypeError(msg)
+        dist_specs.append(_validate(_SAMPLER_DISTRIBUTIONS[sampler],
+                                    *[kwargs.get(name, default)
+                                      for name, default in defaults.items()]))
+    return _rds_many(conn_context, 'DISTRIBUTION_BATCH', dist_specs, num_random, seed,
+                     thread_ratio, output=output)
 
 #For now PAL only supports multinomial, there is no point doing any
 #abstraction. Maybe later if other multivariate sampling algorithms like:
 #multivariate normal is supported, then we can add it.
-def multinomial(conn_context, n, pvals, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments, too-many-locals
+@functools.lru_cache(maxsize=32)
+def _multinomial_spec(num_pvals):
+    """
+    Column spec of the PAL_DISTRIBUTION_RANDOM_MULTIVARIATE input table.
+    """
+    return (('TRIALS', NVARCHAR(100)),) + tuple(
+        ('P{}'.format(i + 1), DOUBLE) for i in range(num_pvals))
+
+@functools.lru_cache(maxsize=32)
+def _multinomial_columns(num_pvals):
+    """
+    Sample column names of the PAL_DISTRIBUTION_RANDOM_MULTIVARIATE result.
+    """
+    return tuple('RANDOM_P{}'.format(i + 1) for i in range(num_pvals))
+
+def multinomial(conn_context, n, pvals, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments, too-many-locals
+                output='dataframe', execute='server'):
     """
     Draw samples from a multinomial distribution.
 
@@ -116,9 +959,18 @@ def multinomial(conn_context, n, pvals, num_random=100, seed=None, thread_ratio=
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -141,10 +993,37 @@ def multinomial(conn_context, n, pvals, num_random=100, seed=None, thread_ratio=
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a numpy.ndarray of shape (num_random, len(pvals)),
+            ordered by ID.
+          - 'pandas': a pandas.DataFrame with the columns described below.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+            `pvals` are normalized to sum to 1.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
+
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -174,51 +1053,97 @@ def multinomial(conn_context, n, pvals, num_random=100, seed=None, thread_ratio=
     8   8        1.0        2.0        3.0        4.0
     9   9        4.0        1.0        1.0        4.0
     """
-    require_pal_usable(conn_context)
     n = arg('n', n, int, True)
     pvals = arg('pvals', pvals, tuple, True)
-    if any((not isinstance(pval, (float, int)) or pval < 0) for pval in pvals):
-        msg = ('Parameter pvals should be a tuple of non-negative floats ' +
-               'and ints.')
-        logger.error(msg)
-        raise ValueError(msg)
-    num_random = arg('num_random', num_random, int)
-    seed = arg('seed', seed, int)
-    thread_ratio = arg('thread_ratio', thread_ratio, float)
+    try:
+        probs = np.asarray(pvals)
+    except ValueError:
+        probs = None
+    if probs is not None and (probs.ndim != 1 or not probs.size or
+                              probs.dtype.kind not in 'biuf'):
+        probs = None
+    if probs is not None:
+        probs = probs.astype(np.float64, copy=False)
+    if probs is None or not np.isfinite(probs).all() or (probs < 0).any():
+        _log_error(_PVALS_MSG)
+        raise ValueError(_PVALS_MSG)
+    if probs.sum() <= 0:
+        _log_error(_PVALS_SUM_MSG)
+        raise ValueError(_PVALS_SUM_MSG)
+    num_random = _as_int('num_random', num_random)
+    seed = _resolve_seed(_as_int('seed', seed))
+    thread_ratio = _as_float('thread_ratio', thread_ratio)
+    output = arg('output', output, _OUTPUTS)
+    execute = arg('execute', execute, _EXECUTES)
     if num_random < 0:
-        msg = 'Parameter num_random should be greater than or equal to zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    unique_id = str(uuid.uuid1()).replace('-', '_').upper()
-    tables = ['#MULTINOMIAL_{}_{}'.format(tbl_name, unique_id) for tbl_name in
-              ['DISTRIBUTION_PARAMETER', 'PARAMETER', 'RESULT']]
-    dist_param_tbl, general_param_tbl, res_tbl = tables
-    dist_param_spec = [('TRIALS', NVARCHAR(100))]
-    dist_param_spec.extend([('P{}'.format(str(i + 1)), DOUBLE) for i in range(len(pvals))])
+        _log_error(_NUM_RANDOM_MSG)
+        raise ValueError(_NUM_RANDOM_MSG)
+    if execute == 'client' or (execute == 'auto' and output != 'dataframe' and
+                               num_random * len(pvals) * 8 <= _CLIENT_MAX_BYTES):
+        rng = np.random.default_rng(seed)
+        if n < len(pvals):
+            # Fewer trials than categories: per-trial alias lookups beat
+            # one binomial draw per category.
+            samples = _multinomial_alias(rng, n, pvals, num_random)
+        else:
+            samples = rng.multinomial(n, probs / probs.sum(), size=num_random)
+        samples = samples.astype(np.float64)
+        columns = _multinomial_columns(len(pvals))
+        if output == 'numpy':
+            return samples
+        if output == 'pandas':
+            res = _samples_frame(samples, columns)
+            res.attrs['seed'] = seed
+            return res
+        res = _upload_samples(conn_context, 'MULTINOMIAL', samples, columns)
+        res.seed = seed
+        return res
+    require_pal_usable(conn_context)
+    suffix = '_' + uuid.uuid4().hex.upper()
+    general_param_tbl = '#MULTINOMIAL_PARAMETER' + suffix
+    res_tbl = '#MULTINOMIAL_RESULT' + suffix
+    tables = [res_tbl]
+    dist_param_spec = _multinomial_spec(len(pvals))
     dist_param_data = [(n,) + pvals]
     general_params = [('DISTRIBUTIONNAME', None, None, 'MULTINOMIAL'),
                       ('NUM_RANDOM', num_random, None, None),
                       ('SEED', seed, None, None),
                       ('THREAD_RATIO', None, thread_ratio, None)]
 
+    pool = _scratch_pool(conn_context)
+    pool_key = 'MULTINOMIAL_{}'.format(len(pvals))
     try:
-        create(conn_context, Table(dist_param_tbl, dist_param_spec).with_data(dist_param_data))
+        dist_param_tbl = pool.acquire(conn_context, pool_key, dist_param_spec, dist_param_data)
+        tables.append(dist_param_tbl)
         call_pal_auto_with_hint(conn_context,
                                 None, 'PAL_DISTRIBUTION_RANDOM_MULTIVARIATE',
                                 conn_context.table(dist_param_tbl),
                                 ParameterTable(general_param_tbl).with_data(general_params),
                                 res_tbl)
-    except dbapi.Error as db_err:
+        if output != 'dataframe':
+            with conn_context.connection.cursor() as cur:
+                execute_logged(cur,
+                               'SELECT * FROM {} ORDER BY "ID"'.format(quotename(res_tbl)),
+                               conn_context.sql_tracer, conn_context)
+                samples = _fetch_numpy(conn_context, cur, num_random, len(pvals) + 1)
+            try_drop(conn_context, res_tbl)
+    except _DB_ERRORS as db_err:
         logger.exception(str(db_err))
         try_drop(conn_context, tables)
         raise
-    except pyodbc.Error as db_err:
-        logger.exception(str(db_err.args[1]))
-        try_drop(conn_context, tables)
-        raise
-    return conn_context.table(res_tbl)
-
-def bernoulli(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None):
+    pool.release(pool_key, dist_param_tbl)
+    if output == 'numpy':
+        return samples[:, 1:]
+    if output == 'pandas':
+        res = _samples_frame(samples[:, 1:], _multinomial_columns(len(pvals)))
+        res.attrs['seed'] = seed
+        return res
+    res = conn_context.table(res_tbl)
+    res.seed = seed
+    return res
+
+def bernoulli(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+              output='dataframe', execute='server'):
     """
     Draw samples from a Bernoulli distribution.
 
@@ -245,9 +1170,18 @@ def bernoulli(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None)
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -270,11 +1204,44 @@ def bernoulli(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None)
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -300,16 +1267,12 @@ def bernoulli(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None)
     8   8               1.0
     9   9               0.0
     """
-    p = arg('p', p, float)
-    if p < 0 or p > 1:
-        msg = 'Parameter p should be in the range of 0 and 1.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'BERNOULLI'),
-                  ('SUCCESS_FRACTION', p)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('BERNOULLI', p)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def beta(conn_context, a=0.5, b=0.5, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments
+def beta(conn_context, a=0.5, b=0.5, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+         output='dataframe', execute='server'):
     """
     Draw samples from a Beta distribution.
 
@@ -342,9 +1305,18 @@ def beta(conn_context, a=0.5, b=0.5, num_random=100, seed=None, thread_ratio=Non
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -367,11 +1339,39 @@ def beta(conn_context, a=0.5, b=0.5, num_random=100, seed=None, thread_ratio=Non
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -398,18 +1398,12 @@ def beta(conn_context, a=0.5, b=0.5, num_random=100, seed=None, thread_ratio=Non
     8   8          0.850181
     9   9          0.976244
     """
-    a = arg('a', a, float)
-    b = arg('b', b, float)
-    if any(x <= 0 for x in (a, b)):
-        msg = 'Parameters a and b should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'BETA'),
-                  ('SHAPE1', a),
-                  ('SHAPE2', b)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('BETA', a, b)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def binomial(conn_context, n=1, p=0.5, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments
+def binomial(conn_context, n=1, p=0.5, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+             output='dataframe', execute='server'):
     """
     Draw samples from a binomial distribution.
 
@@ -444,9 +1438,18 @@ def binomial(conn_context, n=1, p=0.5, num_random=100, seed=None, thread_ratio=N
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -468,11 +1471,39 @@ def binomial(conn_context, n=1, p=0.5, num_random=100, seed=None, thread_ratio=N
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -499,22 +1530,12 @@ def binomial(conn_context, n=1, p=0.5, num_random=100, seed=None, thread_ratio=N
     8   8               0.0
     9   9               1.0
     """
-    p = arg('p', p, float)
-    n = arg('n', n, int)
-    if p < 0 or p > 1:
-        msg = 'Parameter p should be in the range of 0 and 1.'
-        logger.error(msg)
-        raise ValueError(msg)
-    if n < 0:
-        msg = 'Parameter n should be at least zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'BINOMIAL'),
-                  ('SUCCESS_FRACTION', p),
-                  ('TRIALS', n)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('BINOMIAL', p, n)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def cauchy(conn_context, location=0, scale=1, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments
+def cauchy(conn_context, location=0, scale=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+           output='dataframe', execute='server'):
     """
     Draw samples from a cauchy distribution.
 
@@ -542,9 +1563,18 @@ def cauchy(conn_context, location=0, scale=1, num_random=100, seed=None, thread_
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -567,10 +1597,43 @@ def cauchy(conn_context, location=0, scale=1, num_random=100, seed=None, thread_
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -597,18 +1660,12 @@ def cauchy(conn_context, location=0, scale=1, num_random=100, seed=None, thread_
     8   8          0.143280
     9   9          1.277245
     """
-    location = arg('location', location, float)
-    scale = arg('scale', scale, float)
-    if scale <= 0:
-        msg = 'Parameter scale should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'CAUCHY'),
-                  ('LOCATION', location),
-                  ('SCALE', scale)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('CAUCHY', location, scale)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def chi_squared(conn_context, dof=1, num_random=100, seed=None, thread_ratio=None):
+def chi_squared(conn_context, dof=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+                output='dataframe', execute='server'):
     """
     Draw samples from a chi_squared distribution.
 
@@ -634,9 +1691,18 @@ def chi_squared(conn_context, dof=1, num_random=100, seed=None, thread_ratio=Non
     seed : int, optional
 
         Indicates the seed used to initialize the random number generator:
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -659,11 +1725,39 @@ def chi_squared(conn_context, dof=1, num_random=100, seed=None, thread_ratio=Non
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -690,16 +1784,12 @@ def chi_squared(conn_context, dof=1, num_random=100, seed=None, thread_ratio=Non
     8   8          0.013953
     9   9          0.011735
     """
-    dof = arg('dof', dof, int)
-    if dof <= 0:
-        msg = 'Parameter dof should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'CHI_SQUARED'),
-                  ('DEGREES_OF_FREEDOM', dof)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('CHI_SQUARED', dof)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def exponential(conn_context, lamb=1, num_random=100, seed=None, thread_ratio=None):
+def exponential(conn_context, lamb=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+                output='dataframe', execute='server'):
     r"""
     Draw samples from an exponential distribution.
 
@@ -726,9 +1816,18 @@ def exponential(conn_context, lamb=1, num_random=100, seed=None, thread_ratio=No
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -751,10 +1850,43 @@ def exponential(conn_context, lamb=1, num_random=100, seed=None, thread_ratio=No
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -781,17 +1913,12 @@ def exponential(conn_context, lamb=1, num_random=100, seed=None, thread_ratio=No
     8   8          1.233268
     9   9          0.876022
     """
-    lamb = arg('lamb', lamb, float)
-    if lamb <= 0:
-        msg = 'Parameter lamb should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'EXPONENTIAL'),
-                  ('RATE', lamb)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('EXPONENTIAL', lamb)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
 def gumbel(conn_context, location=0, scale=1, num_random=100, seed=None,# pylint: disable=too-many-arguments
-           thread_ratio=None):
+           thread_ratio=None, output='dataframe', execute='server'):
     r"""
     Draw samples from a Gumbel distribution, which is one of a class of
     Generalized Extreme Value (GEV) distributions used in modeling
@@ -817,9 +1944,18 @@ def gumbel(conn_context, location=0, scale=1, num_random=100, seed=None,# pylint
     seed : int, optional
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -841,9 +1977,43 @@ def gumbel(conn_context, location=0, scale=1, num_random=100, seed=None,# pylint
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
+
     Returns
     -------
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -870,18 +2040,12 @@ def gumbel(conn_context, location=0, scale=1, num_random=100, seed=None,# pylint
     8   8         -0.443717
     9   9          0.156404
     """
-    location = arg('location', location, float)
-    scale = arg('scale', scale, float)
-    if scale <= 0:
-        msg = 'Parameter scale should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'EXTREME_VALUE'),
-                  ('LOCATION', location),
-                  ('SCALE', scale)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('EXTREME_VALUE', location, scale)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def f(conn_context, dof1=1, dof2=1, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments, invalid-name
+def f(conn_context, dof1=1, dof2=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments, invalid-name
+      output='dataframe', execute='server'):
     """
     Draw samples from an f distribution.
 
@@ -914,9 +2078,18 @@ def f(conn_context, dof1=1, dof2=1, num_random=100, seed=None, thread_ratio=None
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
             When multithreading is enabled, the random number sequences
             of different runs might be different even if the SEED value
@@ -938,10 +2111,38 @@ def f(conn_context, dof1=1, dof2=1, num_random=100, seed=None, thread_ratio=None
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -968,18 +2169,12 @@ def f(conn_context, dof1=1, dof2=1, num_random=100, seed=None, thread_ratio=None
     8   8          0.019763
     9   9         10.553533
     """
-    dof1 = arg('dof1', dof1, float)
-    dof2 = arg('dof2', dof2, float)
-    if any(dof <= 0 for dof in (dof1, dof2)):
-        msg = 'Parameters dof1 and dof2 should be positive.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'FISHER_F'),
-                  ('DEGREES_OF_FREEDOM1', dof1),
-                  ('DEGREES_OF_FREEDOM2', dof2)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('FISHER_F', dof1, dof2)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def gamma(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments
+def gamma(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+          output='dataframe', execute='server'):
     """
     Draw samples from a gamma distribution.
 
@@ -1007,9 +2202,18 @@ def gamma(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_rati
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1032,11 +2236,47 @@ def gamma(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_rati
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL. Draws of
+            10**6 samples or more use parallel numba kernels instead if
+            numba is installed and runs on more than one thread. The
+            kernels use another generator than NumPy, so the same `seed`
+            gives unrelated sequences on either side of that size, e.g. for
+            999999 and 1000000 samples, and depending on whether numba is
+            used. The first such draw also waits for numba to compile the
+            kernels, which takes seconds; later processes load them from
+            numba's disk cache instead.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1062,18 +2302,12 @@ def gamma(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_rati
     8   8          0.440999
     9   9          0.463645
     """
-    shape = arg('shape', shape, float)
-    scale = arg('scale', scale, float)
-    if any(x <= 0 for x in (shape, scale)):
-        msg = 'Parameters shape and scale should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'GAMMA'),
-                  ('SHAPE', shape),
-                  ('SCALE', scale)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('GAMMA', shape, scale)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def geometric(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments
+def geometric(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+              output='dataframe', execute='server'):
     """
     Draw samples from a geometric distribution.
 
@@ -1099,9 +2333,18 @@ def geometric(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None)
     seed : int, optional
 
         Indicates the seed used to initialize the random number generator:
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note::
 
             When multithreading is enabled, the random number sequences
@@ -1124,11 +2367,39 @@ def geometric(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None)
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1155,17 +2426,12 @@ def geometric(conn_context, p=0.5, num_random=100, seed=None, thread_ratio=None)
     8   8               0.0
     9   9               0.0
     """
-    p = arg('p', p, float)
-    if p < 0 or p > 1:
-        msg = 'Parameter p should be in the range of 0 and 1'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'GEOMETRIC'),
-                  ('SUCCESS_FRACTION', p)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('GEOMETRIC', p)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
 def lognormal(conn_context, mean=0, sigma=1, num_random=100, seed=None,# pylint: disable=too-many-arguments
-              thread_ratio=None):
+              thread_ratio=None, output='dataframe', execute='server'):
     """
     Draw samples from a lognormal distribution.
 
@@ -1198,9 +2464,18 @@ def lognormal(conn_context, mean=0, sigma=1, num_random=100, seed=None,# pylint:
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1223,11 +2498,44 @@ def lognormal(conn_context, mean=0, sigma=1, num_random=100, seed=None,# pylint:
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1253,21 +2561,14 @@ def lognormal(conn_context, mean=0, sigma=1, num_random=100, seed=None,# pylint:
     8   8          1.104031
     9   9          0.840102
     """
-    mean = arg('mean', mean, float)
-    sigma = arg('sigma', sigma, float)
-    if sigma <= 0:
-        msg = 'Parameter sigma should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'LOGNORMAL'),
-                  ('LOCATION', mean),
-                  ('SCALE', sigma)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('LOGNORMAL', mean, sigma)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
 #Parameter n is related to the sucess number, and it should be int.
 #However PAL also accepts float, and truncates it as int.
 def negative_binomial(conn_context, n=1, p=0.5, num_random=100, seed=None,# pylint: disable=too-many-arguments
-                      thread_ratio=None):
+                      thread_ratio=None, output='dataframe', execute='server'):
     """
     Draw samples from a negative_binomial distribution.
 
@@ -1300,9 +2601,18 @@ def negative_binomial(conn_context, n=1, p=0.5, num_random=100, seed=None,# pyli
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1325,11 +2635,39 @@ def negative_binomial(conn_context, n=1, p=0.5, num_random=100, seed=None,# pyli
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
         Dataframe containing the generated random samples,
         structured as follows:
 
@@ -1355,25 +2693,12 @@ def negative_binomial(conn_context, n=1, p=0.5, num_random=100, seed=None,# pyli
     8   8               2.0
     9   9               3.0
     """
-    n = arg('n', n, (int, float))
-    if n is not None:
-        n = int(n)
-    p = arg('p', p, float)
-    if n <= 0:
-        msg = 'Parameter n should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    if p < 0 or p > 1:
-        msg = 'Parameter p should be in the range of 0 and 1.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'NEGATIVE_BINOMIAL'),
-                  ('SUCCESSES', n),
-                  ('SUCCESS_FRACTION', p)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('NEGATIVE_BINOMIAL', n, p)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
 def normal(conn_context, mean=0, sigma=None, variance=None, num_random=100,# pylint: disable=too-many-arguments
-           seed=None, thread_ratio=None):
+           seed=None, thread_ratio=None, output='dataframe', execute='server'):
     """
     Draw samples from a normal distribution.
 
@@ -1412,9 +2737,18 @@ def normal(conn_context, mean=0, sigma=None, variance=None, num_random=100,# pyl
 
         Indicates the seed used to initialize the random number generator:
 
-            - 0: Uses the system time.
+            - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+              if one is set, or else a seed drawn from ``os.urandom``. The seed
+              is recorded in the ``seed`` attribute of a returned DataFrame,
+              or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+              samples can be reproduced. A numpy array cannot record it; pass
+              a `seed`, or set a :func:`seed_stream`, to reproduce one.
             - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1437,10 +2771,52 @@ def normal(conn_context, mean=0, sigma=None, variance=None, num_random=100,# pyl
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL. Draws of
+            10**6 samples or more use parallel numba kernels instead if
+            numba is installed and runs on more than one thread. The
+            kernels use another generator than NumPy, so the same `seed`
+            gives unrelated sequences on either side of that size, e.g. for
+            999999 and 1000000 samples, and depending on whether numba is
+            used. The first such draw also waits for numba to compile the
+            kernels, which takes seconds; later processes load them from
+            numba's disk cache instead.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
+
     Returns
     -------
 
-     DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1467,26 +2843,13 @@ def normal(conn_context, mean=0, sigma=None, variance=None, num_random=100,# pyl
     8   8         -0.534899
     9   9         -0.420968
     """
-    mean = arg('mean', mean, float)
-    sigma = arg('sigma', sigma, float)
-    variance = arg('variance', variance, float)
-    if sigma is not None and variance is not None:
-        msg = ('Parameters variance and sigma cannot be used together. ' +
-               'Please choose one from them.')
-        logger.error(msg)
-        raise ValueError(msg)
-    if sigma <= 0:
-        msg = 'Parameter sigma should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'NORMAL'),
-                  ('MEAN', mean),
-                  ('VARIANCE', variance),
-                  ('SD', sigma)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('NORMAL', mean, variance, sigma)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
 def pert(conn_context, minimum=-1, mode=0, maximum=1, scale=4,# pylint: disable=too-many-arguments
-         num_random=100, seed=None, thread_ratio=None):
+         num_random=100, seed=None, thread_ratio=None, output='dataframe',
+         execute='server'):
     """
     Draw samples from a PERT distribution.
 
@@ -1529,9 +2892,18 @@ def pert(conn_context, minimum=-1, mode=0, maximum=1, scale=4,# pylint: disable=
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1554,11 +2926,39 @@ def pert(conn_context, minimum=-1, mode=0, maximum=1, scale=4,# pylint: disable=
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1585,24 +2985,12 @@ def pert(conn_context, minimum=-1, mode=0, maximum=1, scale=4,# pylint: disable=
     8   8         -0.287202
     9   9          0.468597
     """
-    minimum = arg('minimum', minimum, float)
-    mode = arg('mode', mode, float)
-    maximum = arg('maximum', maximum, float)
-    scale = arg('scale', scale, float)
-    # MIN < MODE < MAX
-    if sorted([minimum, mode, maximum]) != [minimum, mode, maximum]:
-        msg = ('minimum should be less than or equal to mode, ' +
-               'and mode should be less than or equal to maximum.')
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'PERT'),
-                  ('MIN', minimum),
-                  ('MODE', mode),
-                  ('MAX', maximum),
-                  ('SCALE', scale)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('PERT', minimum, mode, maximum, scale)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def poisson(conn_context, theta=1.0, num_random=100, seed=None, thread_ratio=None):
+def poisson(conn_context, theta=1.0, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+            output='dataframe', execute='server'):
     """
     Draw samples from a poisson distribution.
 
@@ -1629,9 +3017,18 @@ def poisson(conn_context, theta=1.0, num_random=100, seed=None, thread_ratio=Non
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1654,11 +3051,47 @@ def poisson(conn_context, theta=1.0, num_random=100, seed=None, thread_ratio=Non
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL. Draws of
+            10**6 samples or more use parallel numba kernels instead if
+            numba is installed and runs on more than one thread. The
+            kernels use another generator than NumPy, so the same `seed`
+            gives unrelated sequences on either side of that size, e.g. for
+            999999 and 1000000 samples, and depending on whether numba is
+            used. The first such draw also waits for numba to compile the
+            kernels, which takes seconds; later processes load them from
+            numba's disk cache instead.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1685,16 +3118,12 @@ def poisson(conn_context, theta=1.0, num_random=100, seed=None, thread_ratio=Non
     8   8               0.0
     9   9               1.0
     """
-    theta = arg('theta', theta, float)
-    if theta <= 0:
-        msg = 'Parameter theta should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'POISSON'),
-                  ('THETA', theta)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('POISSON', theta)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def student_t(conn_context, dof=1, num_random=100, seed=None, thread_ratio=None):
+def student_t(conn_context, dof=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+              output='dataframe', execute='server'):
     """
     Draw samples from a Student's t-distribution.
 
@@ -1721,9 +3150,18 @@ def student_t(conn_context, dof=1, num_random=100, seed=None, thread_ratio=None)
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1746,11 +3184,39 @@ def student_t(conn_context, dof=1, num_random=100, seed=None, thread_ratio=None)
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1777,16 +3243,12 @@ def student_t(conn_context, dof=1, num_random=100, seed=None, thread_ratio=None)
     8   8          1.104877
     9   9         -0.017830
     """
-    dof = arg('dof', dof, float)
-    if dof <= 0:
-        msg = 'Parameter dof should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'STUDENT_T'),
-                  ('DEGREES_OF_FREEDOM', dof)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('STUDENT_T', dof)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def uniform(conn_context, low=0, high=1, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments
+def uniform(conn_context, low=0, high=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+            output='dataframe', execute='server'):
     """
     Draw samples from a uniform distribution.
 
@@ -1818,9 +3280,18 @@ def uniform(conn_context, low=0, high=1, num_random=100, seed=None, thread_ratio
 
         Indicates the seed used to initialize the random number generator:
 
-          - 0: Uses the system time.
+          - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+            if one is set, or else a seed drawn from ``os.urandom``. The seed
+            is recorded in the ``seed`` attribute of a returned DataFrame,
+            or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+            samples can be reproduced. A numpy array cannot record it; pass
+            a `seed`, or set a :func:`seed_stream`, to reproduce one.
           - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1843,11 +3314,52 @@ def uniform(conn_context, low=0, high=1, num_random=100, seed=None, thread_ratio
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL. Draws of
+            10**6 samples or more use parallel numba kernels instead if
+            numba is installed and runs on more than one thread. The
+            kernels use another generator than NumPy, so the same `seed`
+            gives unrelated sequences on either side of that size, e.g. for
+            999999 and 1000000 samples, and depending on whether numba is
+            used. The first such draw also waits for numba to compile the
+            kernels, which takes seconds; later processes load them from
+            numba's disk cache instead.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1874,18 +3386,12 @@ def uniform(conn_context, low=0, high=1, num_random=100, seed=None, thread_ratio
     8   8          0.024849
     9   9         -0.441779
     """
-    low = arg('low', low, float)
-    high = arg('high', high, float)
-    if low >= high:
-        msg = 'Value of low should be lower than high.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'UNIFORM'),
-                  ('MIN', low),
-                  ('MAX', high)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('UNIFORM', low, high)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
-def weibull(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_ratio=None):# pylint: disable=too-many-arguments
+def weibull(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_ratio=None,# pylint: disable=too-many-arguments
+            output='dataframe', execute='server'):
     """
     Draw samples from a weibull distribution.
 
@@ -1913,9 +3419,18 @@ def weibull(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_ra
     seed : int, optional
         Indicates the seed used to initialize the random number generator:
 
-            - 0: Uses the system time.
+            - None or 0: Uses the next seed of the thread's :func:`seed_stream`
+              if one is set, or else a seed drawn from ``os.urandom``. The seed
+              is recorded in the ``seed`` attribute of a returned DataFrame,
+              or in ``attrs['seed']`` of a returned pandas DataFrame, so the
+              samples can be reproduced. A numpy array cannot record it; pass
+              a `seed`, or set a :func:`seed_stream`, to reproduce one.
             - Not 0: Uses the specified seed.
 
+        A given seed reproduces PAL's sequence only when the samples are
+        generated by PAL. Samples generated on the client, see `execute`,
+        are drawn with NumPy and form a different sequence for the same seed.
+
         .. note ::
 
             When multithreading is enabled, the random number sequences
@@ -1938,11 +3453,44 @@ def weibull(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_ra
 
         Defaults to 0.
 
+    output : {'dataframe', 'pandas', 'numpy'}, optional
+
+        Specifies the form of the returned samples:
+
+          - 'dataframe': a DataFrame backed by a temporary table.
+          - 'numpy': a one-dimensional numpy.ndarray of the sample values,
+            ordered by ID. The samples are fetched in the same round-trip
+            that generates them and no result table is created.
+          - 'pandas': a pandas.DataFrame with the columns described below,
+            fetched like 'numpy'. This skips creating a DataFrame and
+            calling collect() on it.
+
+        Defaults to 'dataframe'.
+
+    execute : {'server', 'client', 'auto', 'view'}, optional
+
+        Specifies where the samples are generated:
+
+          - 'server': by PAL in the SAP HANA database.
+          - 'client': locally with NumPy, without calling PAL.
+          - 'auto': locally if `output` is not 'dataframe' and the samples
+            take at most 1 MiB, by PAL otherwise. Opt-in only, since small
+            draws then no longer reproduce PAL's sequence for a `seed`.
+          - 'view': by SAP HANA's RAND() in a SELECT statement, without
+            calling PAL or creating a table. The samples are computed when
+            the returned DataFrame, or a statement built on it, is executed,
+            and differ on every execution; use save() to keep them. Cannot
+            be used with `seed`.
+
+        Client-side samples follow the same distribution as PAL's, but not
+        the same sequence for a given `seed`, and ignore `thread_ratio`.
+
+        Defaults to 'server'.
 
     Returns
     -------
 
-    DataFrame
+    DataFrame, pandas.DataFrame or numpy.ndarray
 
         Dataframe containing the generated random samples,
         structured as follows:
@@ -1969,18 +3517,329 @@ def weibull(conn_context, shape=1, scale=1, num_random=100, seed=None, thread_ra
     8   8          0.847514
     9   9          2.368169
     """
-    shape = arg('shape', shape, float)
-    scale = arg('scale', scale, float)
-    if shape <= 0 or scale <= 0:
-        msg = 'Parameters shape and scale should be greater than zero.'
-        logger.error(msg)
-        raise ValueError(msg)
-    dist_param = [('DISTRIBUTIONNAME', 'WEIBULL'),
-                  ('SHAPE', shape),
-                  ('SCALE', scale)]
-    return _rds(conn_context, dist_param, num_random, seed, thread_ratio)
+    dist_param = _validate('WEIBULL', shape, scale)
+    return _rds(conn_context, dist_param, num_random, seed, thread_ratio, output,
+                execute)
 
 #pylint:disable=line-too-long
+_McmcParam = collections.namedtuple('_McmcParam', ['name', 'pal_name', 'kind', 'required',
+                                                   'default'])
+
+# The deprecated location, scale, shape and dof arguments of mcmc.
+_McmcDeprecated = collections.namedtuple('_McmcDeprecated', ['location', 'scale', 'shape', 'dof'])
+
+# Values of mcmc distribution parameters that were not given, called as
+# default(deprecated) only for the parameters of the requested distribution.
+def _rate_default(dep):
+    # The rate of the deprecated scale, only needed when beta is not given.
+    if not dep.scale:
+        msg = 'Parameter beta should be given when scale is {}.'.format(dep.scale)
+        _log_error(msg)
+        raise ValueError(msg)
+    return 1.0/dep.scale
+
+_MCMC_DEFAULTS = {
+    'mu': lambda dep: dep.location,
+    'xi': lambda dep: dep.location,
+    'sigma': lambda dep: dep.scale,
+    'alpha': lambda dep: dep.shape,
+    'nu': lambda dep: dep.dof,
+    'beta': _rate_default,
+}
+
+def _mcmc_param(name, kind='scalar', required=False, default=None):
+    return _McmcParam(name, name.rstrip('_').upper(), kind, required,
+                      default or _MCMC_DEFAULTS.get(name, lambda dep: None))
+
+# Accepted types per kind of mcmc distribution parameter. Vectors set the
+# DIMENSION of the distribution, matrices are passed flattened.
+_MCMC_KINDS = {
+    'scalar': (float, int),
+    'float': float,
+    'vector': (list, np.ndarray),
+    'matrix': (list, np.ndarray),
+}
+
+# Kinds passed to PAL as a one-element list.
+_MCMC_SCALAR_KINDS = frozenset(['scalar', 'float'])
+
+# Parameters of every mcmc distribution, in the order PAL expects them.
+_MCMC_SCHEMAS = {
+    'normal': (_mcmc_param('mu'), _mcmc_param('sigma')),
+    'skew_normal': (_mcmc_param('xi', 'float'),
+                    _mcmc_param('omega', 'float', default=lambda dep: dep.scale),
+                    _mcmc_param('alpha')),
+    'student_t': (_mcmc_param('nu'), _mcmc_param('mu'), _mcmc_param('sigma')),
+    'cauchy': (_mcmc_param('mu'), _mcmc_param('sigma')),
+    'laplace': (_mcmc_param('mu'), _mcmc_param('sigma')),
+    'logistic': (_mcmc_param('mu'), _mcmc_param('sigma')),
+    'gumbel': (_mcmc_param('mu'), _mcmc_param('beta', default=lambda dep: dep.scale)),
+    'exponential': (_mcmc_param('beta'),),
+    'chi_square': (_mcmc_param('nu'),),
+    'invchi_square': (_mcmc_param('nu', required=True),),
+    'weibull': (_mcmc_param('alpha', required=True), _mcmc_param('sigma')),
+    'frechet': (_mcmc_param('alpha', required=True), _mcmc_param('sigma')),
+    'rayleigh': (_mcmc_param('sigma'),),
+    'multinormal': (_mcmc_param('mu', 'vector', True), _mcmc_param('sigma', 'matrix', True)),
+    'multinormalprec': (_mcmc_param('mu', 'vector', True), _mcmc_param('omega', 'matrix', True)),
+    'multinormalcholesky': (_mcmc_param('mu', 'vector', True), _mcmc_param('L', 'matrix', True)),
+    'multistudent_t': (_mcmc_param('nu'), _mcmc_param('mu', 'vector', True),
+                       _mcmc_param('sigma', 'matrix', True)),
+    'dirichlet': (_mcmc_param('alpha', 'vector', True),),
+    'lognormal': (_mcmc_param('mu', required=True), _mcmc_param('sigma')),
+    'invgamma': (_mcmc_param('alpha', required=True), _mcmc_param('beta', required=True)),
+    'beta': (_mcmc_param('alpha', required=True), _mcmc_param('beta', required=True)),
+    'pareto': (_mcmc_param('y_min', 'float', True), _mcmc_param('alpha', required=True)),
+    'lomax': (_mcmc_param('lambda_', 'float', True), _mcmc_param('alpha', required=True)),
+}
+
+_MCMC_DISTRIBUTIONS = {dtr: dtr for dtr in _MCMC_SCHEMAS}
+
+# Exact NumPy samplers of univariate mcmc distributions for local=True, called
+# as sampler(rng, prm, size) with `prm` mapping PAL parameter names to values.
+_MCMC_LOCAL_SAMPLERS = {
+    'normal': lambda rng, prm, size: rng.normal(prm['MU'], prm['SIGMA'], size),
+    'student_t': lambda rng, prm, size: (prm['MU'] +
+                                         prm['SIGMA'] * rng.standard_t(prm['NU'], size)),
+    'cauchy': lambda rng, prm, size: prm['MU'] + prm['SIGMA'] * rng.standard_cauchy(size),
+    'laplace': lambda rng, prm, size: rng.laplace(prm['MU'], prm['SIGMA'], size),
+    'logistic': lambda rng, prm, size: rng.logistic(prm['MU'], prm['SIGMA'], size),
+    'gumbel': lambda rng, prm, size: rng.gumbel(prm['MU'], prm['BETA'], size),
+    'exponential': lambda rng, prm, size: rng.exponential(1.0 / prm['BETA'], size),
+    'chi_square': lambda rng, prm, size: rng.chisquare(prm['NU'], size),
+    'invchi_square': lambda rng, prm, size: 1.0 / rng.chisquare(prm['NU'], size),
+    'weibull': lambda rng, prm, size: prm['SIGMA'] * rng.weibull(prm['ALPHA'], size),
+    'frechet': lambda rng, prm, size: (prm['SIGMA'] *
+                                       rng.standard_exponential(size) ** (-1.0 / prm['ALPHA'])),
+    'rayleigh': lambda rng, prm, size: rng.rayleigh(prm['SIGMA'], size),
+    'lognormal': lambda rng, prm, size: rng.lognormal(prm['MU'], prm['SIGMA'], size),
+    'invgamma': lambda rng, prm, size: prm['BETA'] / rng.gamma(prm['ALPHA'], 1.0, size),
+    'beta': lambda rng, prm, size: rng.beta(prm['ALPHA'], prm['BETA'], size),
+    # NumPy's pareto() draws from the Lomax distribution with unit scale.
+    'pareto': lambda rng, prm, size: prm['Y_MIN'] * (1.0 + rng.pareto(prm['ALPHA'], size)),
+    'lomax': lambda rng, prm, size: prm['LAMBDA'] * rng.pareto(prm['ALPHA'], size),
+}
+
+_LOCAL_MSG = 'Parameter local cannot be combined with num_chains > 1 or session_cache.'
+
+# PAL's default ITER of mcmc, as documented for chain_iter.
+_MCMC_DEFAULT_ITER = 2000
+
+# Length of the STRING_VALUE column of PAL parameter tables.
+_MCMC_PARAM_MAX_LEN = 5000
+
+def _mcmc_distr_param(distribution, param_value, deprecated):
+    """
+    Validate the parameters of `distribution` in `param_value`, filling in
+    missing ones from `deprecated`, and return them as the JSON text of
+    DISTRIBUTION_PARAM together with the DIMENSION of the distribution.
+    """
+    dim = 1
+    distr_param = {}
+    for param in _MCMC_SCHEMAS[distribution]:
+        value = arg(param.name, param_value[param.name], _MCMC_KINDS[param.kind],
+                    required=param.required)
+        if value is None:
+            value = param.default(deprecated)
+        if isinstance(value, np.ndarray):
+            value = value.ravel().tolist()
+        elif param.kind == 'matrix' and value and isinstance(value[0], list):
+            value = np.asarray(value).ravel().tolist()
+        if param.kind == 'vector':
+            dim = len(value)
+        distr_param[param.pal_name] = [value] if param.kind in _MCMC_SCALAR_KINDS else value
+    # default=float covers NumPy scalars inside list-valued parameters.
+    distr_param = json.dumps(distr_param, separators=(',', ':'), default=float)
+    if len(distr_param) > _MCMC_PARAM_MAX_LEN:
+        msg = ('The parameters of the {} distribution take {} characters, more than the ' +
+               '{} a PAL parameter value can hold.').format(distribution, len(distr_param),
+                                                           _MCMC_PARAM_MAX_LEN)
+        _log_error(msg)
+        raise ValueError(msg)
+    return distr_param, dim
+
+def _chain_seeds(random_state, num_chains):
+    """
+    Return distinct positive 31-bit seeds of `num_chains` chains, derived
+    with SplitMix64 from `random_state`, or from a random seed if it is 0.
+    """
+    base = _resolve_seed(random_state)
+    return [_splitmix64((base + (chain + 1) * _SPLITMIX_GAMMA) & _MASK64) >> 33 or 1
+            for chain in range(num_chains)]
+
+def _has_value(row):
+    return any(val is not None for val in row[1:])
+
+def _mcmc_sql(param_rows, call_rows, result_tbl, id_column=None):
+    """
+    Return an anonymous block calling PAL_MCMC once per entry of `call_rows`,
+    with the parameter rows `param_rows` followed by the rows of that entry,
+    and storing the samples in `result_tbl`.
+
+    If `id_column` is given, the samples of each call are tagged with its
+    position in `call_rows` in that column. If `result_tbl` is None, the
+    block instead ends with a SELECT of the samples, so they can be fetched.
+    """
+    invocations = []
+    for call, rows in enumerate(call_rows):
+        # Booleans are passed as ints, as in sqlgen.create_params.
+        extra = ''.join(' UNION ALL SELECT {}, {}, {}, {} FROM DUMMY'.format(
+            sqlgen.literal(name), sqlgen.literal(ival if ival is None else int(ival)),
+            sqlgen.literal(dval), sqlgen.literal(sval))
+                        for name, ival, dval, sval in rows if _has_value((name, ival, dval, sval)))
+        invocations.append('params_{0} = SELECT * FROM :params{1};\n'
+                           'CALL _SYS_AFL.PAL_MCMC(:params_{0}, out_{0});\n'.format(call, extra))
+    if id_column is None:
+        outputs = 'SELECT * FROM :out_0'
+    else:
+        outputs = ' UNION ALL '.join(
+            'SELECT {0} AS {1}, out_{0}.* FROM :out_{0} AS out_{0}'.format(
+                call, quotename(id_column))
+            for call in range(len(call_rows)))
+    if result_tbl is None:
+        extract_output = outputs + ';\n'
+    else:
+        extract_output = 'CREATE LOCAL TEMPORARY COLUMN TABLE {} AS ({});\n'.format(
+            quotename(result_tbl), outputs)
+    return ('DO\nBEGIN\n'
+            + sqlgen.create_params([row for row in param_rows if _has_value(row)])
+            + ''.join(invocations)
+            + extract_output
+            + 'END\n')
+
+def _mcmc_chains_sql(param_rows, seeds, result_tbl):
+    """
+    Return the _mcmc_sql() block running one chain of `param_rows` per seed
+    in `seeds`, tagging the samples with their CHAIN_ID if there are several.
+    """
+    return _mcmc_sql([row for row in param_rows if row[0] != 'RANDOM_SEED'],
+                     [[('RANDOM_SEED', seed, None, None)] for seed in seeds], result_tbl,
+                     'CHAIN_ID' if len(seeds) > 1 else None)
+
+def _execute_mcmc(conn_context, sql):
+    # SQLTRACE
+    conn_context.sql_tracer.trace_object({
+        'name':'PAL_MCMC',
+        'schema': '_SYS_AFL',
+        'type': 'pal'
+    }, sub_cat='function')
+    with conn_context.connection.cursor() as cur:
+        execute_logged(cur, sql, conn_context.sql_tracer, conn_context)
+
+def _refill_mcmc(conn_context, sql, result_tbl):
+    """
+    Replace the rows of the existing `result_tbl` with the samples selected
+    by the _mcmc_sql() block `sql`.
+
+    Anonymous blocks cannot use local temporary tables, so the samples are
+    fetched and written back by statements of their own.
+    """
+    # SQLTRACE
+    conn_context.sql_tracer.trace_object({
+        'name':'PAL_MCMC',
+        'schema': '_SYS_AFL',
+        'type': 'pal'
+    }, sub_cat='function')
+    with conn_context.connection.cursor() as cur:
+        execute_logged(cur, sql, conn_context.sql_tracer, conn_context)
+        samples = [tuple(row) for row in cur.fetchall()]
+        execute_logged(cur, 'TRUNCATE TABLE {}'.format(quotename(result_tbl)),
+                       conn_context.sql_tracer, conn_context)
+        if samples:
+            statement = sql_for_insert_values(result_tbl, samples)
+            # SQLTRACE
+            conn_context.sql_tracer.trace_sql_many(statement, samples)
+            cur.executemany(statement, samples)
+
+def _mcmc_param_rows(distribution, location, scale, shape, dof, chain_iter,#pylint: disable=too-many-arguments, too-many-locals
+                     random_state, init_radius, adapt, warmup, thin, adapt_gamma,
+                     adapt_delta, adapt_kappa, adapt_offset, adapt_init_buffer,
+                     adapt_term_buffer, adapt_window, stepsize, stepsize_jitter,
+                     max_depth, mu, sigma, xi, alpha, beta, nu, omega, L,
+                     y_min, lambda_):
+    """
+    Validate the arguments of one mcmc() chain and return its PAL parameter
+    rows together with the DIMENSION of the distribution.
+    """
+    distribution = arg('distribution', distribution, _MCMC_DISTRIBUTIONS, True)
+    location = arg('location', location, (float, int))
+    shape = arg('shape', shape, (float, int))
+    scale = arg('scale', scale, (float, int))
+    dof = arg('dof', dof, (float, int))
+    chain_iter = _as_int('chain_iter', chain_iter)
+    random_state = _as_int('random_state', random_state)
+    init_radius = _as_float('init_radius', init_radius)
+    adapt = arg('adapt', adapt, bool)
+    warmup = _as_int('warmup', warmup)
+    thin = _as_int('thin', thin)
+    adapt_gamma = _as_float('adapt_gamma', adapt_gamma)
+    adapt_delta = _as_float('adapt_delta', adapt_delta)
+    adapt_kappa = _as_float('adapt_kappa', adapt_kappa)
+    adapt_offset = _as_float('adapt_offset', adapt_offset)
+    adapt_init_buffer = _as_int('adapt_init_buffer', adapt_init_buffer)
+    adapt_term_buffer = _as_int('adapt_term_buffer', adapt_term_buffer)
+    adapt_window = _as_int('adapt_window', adapt_window)
+    stepsize = _as_float('stepsize', stepsize)
+    stepsize_jitter = _as_float('stepsize_jitter', stepsize_jitter)
+    max_depth = _as_int('max_depth', max_depth)
+    if warmup is None:
+        warmup = (_MCMC_DEFAULT_ITER if chain_iter is None else chain_iter) // 2
+    param_value = dict(mu=mu, sigma=sigma, xi=xi,
+                       alpha=alpha, beta=beta,
+                       nu=nu, omega=omega, L=L,
+                       y_min=y_min, lambda_=lambda_)
+    distr_param, dim = _mcmc_distr_param(distribution, param_value,
+                                         _McmcDeprecated(location, scale, shape, dof))
+    param_rows = [('DISTRIBUTION_NAME', None, None, distribution),
+                  ('DISTRIBUTION_PARAM', None, None, distr_param),
+                  ('DIMENSION', dim, None, None),
+                  ('ITER', chain_iter, None, None),
+                  ('RANDOM_SEED', random_state, None, None),
+                  ('INIT_RADIUS', None, init_radius, None),
+                  ('ADAPT_ENGAGED', adapt, None, None),
+                  ('WARMUP', warmup, None, None),
+                  ('THIN', thin, None, None),
+                  ('STEPSIZE', stepsize, None, None),
+                  ('STEPSIZE_JITTER', stepsize_jitter, None, None),
+                  ('MAX_TREEDEPTH', max_depth, None, None)]
+    if adapt is not False:
+        param_rows += [('ADAPT_GAMMA', None, adapt_gamma, None),
+                       ('ADAPT_DELTA', None, adapt_delta, None),
+                       ('ADAPT_KAPPA', None, adapt_kappa, None),
+                       ('ADAPT_T0', None, adapt_offset, None),
+                       ('ADAPT_INIT_BUFFER', adapt_init_buffer, None, None),
+                       ('ADAPT_TERM_BUFFER', adapt_term_buffer, None, None),
+                       ('ADAPT_WINDOW', adapt_window, None, None)]
+    return param_rows, dim
+
+def _mcmc_local(conn_context, param_rows):
+    """
+    Draw the samples PAL_MCMC would return for `param_rows` locally as
+    independent draws with NumPy, and upload them as the result table.
+    """
+    values = {pname: next((value for value in (ival, dval, sval) if value is not None), None)
+              for pname, ival, dval, sval in param_rows}
+    distribution = values['DISTRIBUTION_NAME']
+    if distribution not in _MCMC_LOCAL_SAMPLERS:
+        msg = 'Parameter local is not supported for the {} distribution.'.format(distribution)
+        _log_error(msg)
+        raise ValueError(msg)
+    prm = {name: value[0] for name, value in json.loads(values['DISTRIBUTION_PARAM']).items()}
+    chain_iter = values['ITER'] or _MCMC_DEFAULT_ITER
+    # PAL returns 6 samples for chain_iter=50 and thin=10 (see the mcmc()
+    # example), i.e. every thin-th of the iterations 0 .. chain_iter.
+    size = chain_iter // (values['THIN'] or 1) + 1
+    rng = np.random.default_rng(_resolve_seed(values['RANDOM_SEED']))
+    samples = _MCMC_LOCAL_SAMPLERS[distribution](rng, prm, size).astype(np.float64)
+    return _upload_samples(conn_context, 'PAL_MCMC', samples, ['SAMPLES'])
+
+def _mcmc_session_tables(conn_context):
+    # pylint: disable=protected-access
+    tables = getattr(conn_context, '_mcmc_session_tables', None)
+    if tables is None:
+        tables = conn_context._mcmc_session_tables = set()
+    return tables
+
 def mcmc(conn_context, distribution, location=0.0,#pylint:disable=too-many-locals, too-many-arguments, too-many-statements, too-many-branches
          scale=1.0, shape=1.0, dof=1.0, chain_iter=None,
          random_state=None, init_radius=None, adapt=None,
@@ -1990,7 +3849,8 @@ def mcmc(conn_context, distribution, location=0.0,#pylint:disable=too-many-local
          adapt_window=None, stepsize=None, stepsize_jitter=None,
          max_depth=None, mu=None, sigma=None, xi=None,
          alpha=None, beta=None, nu=None, omega=None, L=None,#pylint:disable=redefined-outer-name
-         y_min=None, lambda_=None):#pylint:disable=redefined-outer-name
+         y_min=None, lambda_=None, num_chains=1,#pylint:disable=redefined-outer-name
+         session_cache=False, lazy=False, local=False):
     r"""
     Given a distribution, this function generates samples of the distribution
     using Markov chain  Monte Carlo simulation.
@@ -2155,6 +4015,50 @@ def mcmc(conn_context, distribution, location=0.0,#pylint:disable=too-many-local
 
         Defaults to 2000.
 
+    num_chains : int, optional
+
+        Specifies the number of Markov chains to run. All chains are run
+        by one anonymous block in a single round-trip, each seeded from
+        ``random_state`` (or a random seed if it is 0) and the chain number.
+        If greater than 1, the result starts with an extra CHAIN_ID column
+        numbering the chains from 0.
+
+        Defaults to 1.
+
+    session_cache : bool, optional
+
+        If True, the samples are stored in a local temporary table that is
+        kept for the session and truncated and refilled by the next call
+        with the same ``session_cache`` setting and result layout, which
+        saves creating a table per call. DataFrames returned by earlier
+        calls then show the samples of the latest call. Anonymous blocks
+        cannot write to local temporary tables, so a refill fetches the
+        samples and inserts them back, which pays off for short chains.
+
+        Defaults to False.
+
+    lazy : bool, optional
+
+        If True, the returned DataFrame does not record the schema of its
+        source table, which saves the round-trip querying the current
+        schema. Its columns are fetched on first use in either case.
+
+        Defaults to False.
+
+    local : bool, optional
+
+        If True, returns independent (i.i.d.) draws of the distribution,
+        not a Markov chain: the samples are drawn on the client with NumPy
+        and uploaded instead of being generated by PAL, which is much faster
+        for short chains. The adaption and sampler arguments are ignored.
+        The number of samples follows the output of PAL for ``chain_iter``
+        and ``thin``, e.g. 6 samples for ``chain_iter`` = 50 and ``thin`` =
+        10 as in the example below.
+        Supported for the univariate distributions except 'skew_normal',
+        and not with ``num_chains`` > 1 or ``session_cache``.
+
+        Defaults to False.
+
     random_state : int, optional
 
         Specifies the seed used to initialize the random number generator,
@@ -2355,157 +4259,145 @@ def mcmc(conn_context, distribution, location=0.0,#pylint:disable=too-many-local
     4   4  0.220282
     5   5 -5.588809
     """
+    random_state = _as_int('random_state', random_state)
+    session_cache = arg('session_cache', session_cache, bool)
+    lazy = arg('lazy', lazy, bool)
+    local = arg('local', local, bool)
+    num_chains = _as_int('num_chains', num_chains)
+    if num_chains < 1:
+        _log_error(_NUM_CHAINS_MSG)
+        raise ValueError(_NUM_CHAINS_MSG)
+    if local and (num_chains > 1 or session_cache):
+        _log_error(_LOCAL_MSG)
+        raise ValueError(_LOCAL_MSG)
+    param_rows, dim = _mcmc_param_rows(
+        distribution, location, scale, shape, dof, chain_iter, random_state, init_radius,
+        adapt, warmup, thin, adapt_gamma, adapt_delta, adapt_kappa, adapt_offset,
+        adapt_init_buffer, adapt_term_buffer, adapt_window, stepsize, stepsize_jitter,
+        max_depth, mu, sigma, xi, alpha, beta, nu, omega, L, y_min, lambda_)
+    if local:
+        return _mcmc_local(conn_context, param_rows)
     require_pal_usable(conn_context)
-    dstr_param_lst = {'normal':['mu', 'sigma'],
-                      'skew_normal':['xi', 'omega', 'alpha'],
-                      'student_t':['nu', 'mu', 'sigma'],
-                      'cauchy':['mu', 'sigma'],
-                      'laplace':['mu', 'sigma'],
-                      'logistic':['mu', 'sigma'],
-                      'gumbel':['mu', 'beta'],
-                      'exponential':['beta'],
-                      'chi_square':['nu'],
-                      'invchi_square':['nu'],
-                      'weibull':['alpha', 'sigma'],
-                      'frechet':['alpha', 'sigma'],
-                      'rayleigh':['sigma'],
-                      'multinormal':['mu', 'sigma'],
-                      'multinormalprec':['mu', 'omega'],
-                      'multinormalcholesky':['mu', 'L'],
-                      'mutistudent_t':['nu', 'mu', 'sigma'],
-                      'dirichlet':['alpha'],
-                      'lognormal':['mu', 'sigma'],
-                      'invgamma':['alpha', 'beta'],
-                      'beta':['alpha', 'beta'],
-                      'pareto':['y_min', 'alpha'],
-                      'lomax':['lambda', 'alpha']}
-    distribution = arg('distribution', distribution,
-                       {dtr:dtr for dtr in dstr_param_lst},
-                       True)
-    location = arg('location', location, (float, int))
-    shape = arg('shape', shape, (float, int))
-    scale = arg('scale', scale, (float, int))
-    dof = arg('dof', dof, (float, int))
-    chain_iter = arg('chain_iter', chain_iter, int)
-    random_state = arg('random_state', random_state, int)
-    init_radius = arg('init_radius', init_radius, float)
-    adapt = arg('adapt', adapt, bool)
-    warmup = arg('warmup', warmup, int)
-    thin = arg('thin', thin, int)
-    adapt_gamma = arg('adapt_gamma', adapt_gamma, float)
-    adapt_delta = arg('adapt_delta', adapt_delta, float)
-    adapt_kappa = arg('adapt_kappa', adapt_kappa, float)
-    adapt_offset = arg('adapt_offset', adapt_offset, float)
-    adapt_init_buffer = arg('adapt_init_buffer', adapt_init_buffer,
-                            int)
-    adapt_term_buffer = arg('adapt_term_buffer', adapt_term_buffer, int)
-    adapt_window = arg('adapt_window', adapt_window, int)
-    stepsize = arg('stepsize', stepsize, float)
-    stepsize_jitter = arg('stepsize_jitter', stepsize_jitter, float)
-    max_depth = arg('max_depth', max_depth, int)
-    dim = 1
-    mu = arg('mu', mu,
-             (list, np.ndarray) if 'multi' in distribution else (float, int),
-             required='multi' in distribution or distribution == 'lognormal')
-    if isinstance(mu, np.ndarray):
-        mu = list(mu.reshape([-1]))
-    if isinstance(mu, list) and 'multi' in distribution:
-        dim = len(mu)
-    if mu is None:
-        mu = location
-    sigma = arg('sigma', sigma,
-                (list, np.ndarray) if distribution in ['multinormal', 'multistudent_t']\
-                else (float, int),
-                required=distribution in ['multinormal', 'multistudent_t'])
-    if isinstance(sigma, np.ndarray):
-        sigma = list(sigma.reshape([-1]))
-    if sigma is None:
-        sigma = scale
-    xi = arg('xi', xi, float)
-    if xi is None:
-        xi = location
-    alpha = arg('alpha', alpha,
-                (list, np.ndarray) if distribution == 'dirichlet' else (float, int),
-                required=distribution in ['dirichlet', 'weibull',
-                                          'frechet', 'beta',
-                                          'pareto', 'lomax',
-                                          'invgamma'])
-    if isinstance(alpha, np.ndarray):
-        alpha = list(alpha.reshape([-1]))
-    if isinstance(alpha, list) and 'diri' in distribution:
-        dim = len(alpha)
-    if alpha is None:
-        alpha = shape
-    beta = arg('beta', beta, (float, int),
-               required=distribution in ['invgamma', 'beta'])
-    if beta is None:
-        beta = scale if distribution == 'gumbel' else 1.0/scale
-    nu = arg('nu', nu, (float, int),
-             required=distribution == 'invchi_square')
-    if nu is None:
-        nu = dof
-    omega = arg('omega', omega,
-                (list, np.ndarray) if 'normalprec' in distribution else float,
-                required=distribution == 'multinormalprec')
-    if isinstance(omega, np.ndarray):
-        omega = list(omega.reshape([-1]))
-    elif isinstance(omega, list) and isinstance(omega[0], list):
-        omega = list(np.array(omega).reshape([-1]))
-    L = arg('L', L, (list, np.ndarray),
-            required=distribution == 'multinormalcholesky')
-    if isinstance(L, np.ndarray):
-        L = list(L.reshape([-1]))
-    elif isinstance(L, list) and isinstance(L[0], list):
-        L = list(np.array(L).reshape([-1]))
-    y_min = arg('y_min', y_min, float,
-                required=distribution == 'pareto')
-    lambda_ = arg('lambda_', lambda_, float,
-                  required=distribution == 'lomax')
-    param_value = dict(mu=mu, sigma=sigma, xi=xi,
-                       alpha=alpha, beta=beta,
-                       nu=nu, omega=omega, L=L,
-                       y_min=y_min)
-    param_value['lambda'] = lambda_
-    distr_param = {param.upper():[param_value[param]] if not isinstance(param_value[param], list) \
-                   else param_value[param] for param in dstr_param_lst[distribution]}
-    param_rows = [('DISTRIBUTION_NAME', None, None, distribution)]
-    param_rows.extend([('DISTRIBUTION_PARAM', None, None,
-                        str(distr_param).replace("'", '"')),
-                       ('DIMENSION', dim, None, None)])
-    extend_array = [('ITER', chain_iter, None, None),
-                    ('RANDOM_SEED', random_state, None, None),
-                    ('INIT_RADIUS', None, init_radius, None),
-                    ('ADAPT_ENGAGED', adapt, None, None),
-                    ('WARMUP', warmup, None, None),
-                    ('THIN', thin, None, None),
-                    ('STEPSIZE', stepsize, None, None),
-                    ('STEPSIZE_JITTER', stepsize_jitter, None, None),
-                    ('MAX_TREEDEPTH', max_depth, None, None)]
-    param_rows.extend(extend_array)
-    if adapt is not False:
-        extend_rows = [('ADAPT_GAMMA', None, adapt_gamma, None),
-                       ('ADAPT_DELTA', None, adapt_delta, None),
-                       ('ADAPT_KAPPA', None, adapt_kappa, None),
-                       ('ADAPT_T0', None, adapt_offset, None),
-                       ('ADAPT_INIT_BUFFER', adapt_init_buffer, None, None),
-                       ('ADAPT_TERM_BUFFER', adapt_term_buffer, None, None),
-                       ('ADAPT_WINDOW', adapt_window, None, None)]
-        param_rows.extend(extend_rows)
-    unique_id = str(uuid.uuid1()).replace('-', '_').upper()
-    tables = ["#PAL_MCMC_{}_TBL_{}".format(name, unique_id)
-              for name in ['PARAMETER', 'RESULT']]
-    param_tbl, result_tbl = tables
+    seeds = _chain_seeds(random_state, num_chains) if num_chains > 1 else [random_state]
+    if session_cache:
+        suffix = 'SESSION_{}_{}'.format(dim, len(seeds))
+    else:
+        suffix = uuid.uuid4().hex.upper()
+    result_tbl = '#PAL_MCMC_RESULT_TBL_' + suffix
+    # Only the single chain call goes through a parameter table; the chains
+    # of _mcmc_chains_sql pass their parameters as table variables.
+    tables = [result_tbl]
+    if num_chains == 1:
+        param_tbl = '#PAL_MCMC_PARAMETER_TBL_' + suffix
+        tables.insert(0, param_tbl)
+    session_tables = _mcmc_session_tables(conn_context)
+    if session_cache and result_tbl in session_tables:
+        try:
+            _refill_mcmc(conn_context, _mcmc_chains_sql(param_rows, seeds, None), result_tbl)
+            return conn_context.table(result_tbl, save_source=not lazy)
+        except _DB_ERRORS as db_err:
+            logger.warning('Reusing %s failed, creating it again: %s', result_tbl, db_err)
+            session_tables.discard(result_tbl)
+            try_drop(conn_context, tables)
     try:
-        call_pal_auto_with_hint(conn_context,
-                                None, "PAL_MCMC",
-                                ParameterTable(param_tbl).with_data(param_rows),
-                                result_tbl)
-    except dbapi.Error as db_err:
+        if num_chains > 1:
+            _execute_mcmc(conn_context, _mcmc_chains_sql(param_rows, seeds, result_tbl))
+        else:
+            call_pal_auto_with_hint(conn_context,
+                                    None, "PAL_MCMC",
+                                    ParameterTable(param_tbl).with_data(param_rows),
+                                    result_tbl)
+    except _DB_ERRORS as db_err:
         logger.exception(str(db_err))
         try_drop(conn_context, tables)
         raise
-    except pyodbc.Error as db_err:
-        logger.exception(str(db_err.args[1]))
-        try_drop(conn_context, tables)
+    if session_cache:
+        session_tables.add(result_tbl)
+    return conn_context.table(result_tbl, save_source=not lazy)
+
+@functools.lru_cache(maxsize=1)
+def _mcmc_defaults():
+    """
+    Default values of the mcmc() arguments that make up one parameter set.
+    """
+    parameters = inspect.signature(mcmc).parameters
+    return {name: parameters[name].default
+            for name in inspect.signature(_mcmc_param_rows).parameters}
+
+def mcmc_batch(conn_context, param_grid):
+    """
+    Run :func:`mcmc` for several parameter sets, e.g. a grid of
+    hyperparameters, in a single anonymous block and round-trip.
+
+    Parameters
+    ----------
+
+    conn_context :  ConnectionContext
+
+        Database connection object.
+
+    param_grid : list of dict
+
+        Keyword arguments of :func:`mcmc` for each parameter set, each
+        including ``distribution``. ``num_chains``, ``session_cache``,
+        ``lazy`` and ``local`` are not supported. All parameter sets must
+        have the same dimension.
+
+    Returns
+    -------
+
+    dict of DataFrame
+
+        Samples of each parameter set, keyed by its position in `param_grid`.
+        They are views of one result table, laid out as the result of
+        :func:`mcmc` with an extra leading PARAM_SET_ID column.
+
+    Examples
+    --------
+
+    >>> res = mcmc_batch(conn_context=cc,
+    ...                  param_grid=[dict(distribution='normal', mu=0.0, sigma=sigma,
+    ...                                   chain_iter=50, random_state=1)
+    ...                              for sigma in (0.5, 1.0, 2.0)])
+    >>> res[2].head(3).collect()
+       PARAM_SET_ID  ID   SAMPLES
+    0             2   0 -1.397238
+    1             2   1  3.184866
+    2             2   2 -0.585530
+    """
+    require_pal_usable(conn_context)
+    param_grid = arg('param_grid', param_grid, list, True)
+    if not param_grid or any(not isinstance(params, dict) or 'distribution' not in params
+                             for params in param_grid):
+        _log_error(_PARAM_GRID_MSG)
+        raise ValueError(_PARAM_GRID_MSG)
+    defaults = _mcmc_defaults()
+    row_sets = []
+    dims = set()
+    for params in param_grid:
+        unknown = sorted(set(params) - set(defaults))
+        if unknown:
+            msg = 'mcmc_batch() got unexpected mcmc arguments {}.'.format(unknown)
+            _log_error(msg)
+            raise TypeError(msg)
+        kwargs = dict(defaults)
+        kwargs.update(params)
+        param_rows, dim = _mcmc_param_rows(**kwargs)
+        row_sets.append(param_rows)
+        dims.add(dim)
+    if len(dims) > 1:
+        _log_error(_PARAM_GRID_DIM_MSG)
+        raise ValueError(_PARAM_GRID_DIM_MSG)
+    result_tbl = '#PAL_MCMC_RESULT_TBL_' + uuid.uuid4().hex.upper()
+    # Rows shared by all parameter sets are sent once.
+    shared = [row for row in row_sets[0] if all(row in rows for rows in row_sets[1:])]
+    sql = _mcmc_sql(shared, [[row for row in rows if row not in shared] for rows in row_sets],
+                    result_tbl, 'PARAM_SET_ID')
+    try:
+        _execute_mcmc(conn_context, sql)
+    except _DB_ERRORS as db_err:
+        logger.exception(str(db_err))
+        try_drop(conn_context, result_tbl)
         raise
-    return conn_context.table(result_tbl)
+    res = conn_context.table(result_tbl)
+    return {i: res.filter('"PARAM_SET_ID" = {}'.format(i)) for i in range(len(row_sets))}
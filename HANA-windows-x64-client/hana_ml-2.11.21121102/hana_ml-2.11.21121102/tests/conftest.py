@@ -0,0 +1,149 @@
+"""
+Fixtures of the hana_ml tests.
+
+Most tests run without a SAP HANA instance: `conn_context` is a
+ConnectionContext over a fake connection that records every statement it
+is given and answers queries with canned rows.
+
+Tests marked ``hana`` need a real server with PAL, given by the
+HANA_ML_TEST_ADDRESS, HANA_ML_TEST_PORT, HANA_ML_TEST_USER and
+HANA_ML_TEST_PASSWORD environment variables, and are skipped without them.
+Run only those with ``pytest -m hana``.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+#pylint: disable=wrong-import-position
+from hdbcli import dbapi
+from hana_ml.dataframe import ConnectionContext, SqlTrace
+
+_SERVER_VARIABLES = ['HANA_ML_TEST_ADDRESS', 'HANA_ML_TEST_PORT', 'HANA_ML_TEST_USER',
+                     'HANA_ML_TEST_PASSWORD']
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'hana: needs a SAP HANA server with PAL')
+
+class FakeCursor(object):#pylint: disable=useless-object-inheritance
+    """
+    Cursor of FakeConnection.
+    """
+    def __init__(self, connection):
+        self.connection = connection
+        self.description = [('ID', 3, 10, 10, 0, 1), ('GENERATED_NUMBER', 7, 15, 15, 0, 1)]
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _check(self, sql):
+        if any(pattern in sql for pattern in self.connection.fail_on):
+            raise dbapi.Error(-1, 'statement failed: ' + sql)
+
+    def execute(self, sql, params=None):#pylint: disable=unused-argument
+        """
+        Record `sql` and make the rows it selects pending.
+        """
+        self._check(sql)
+        self.connection.statements.append(sql)
+        if sql.startswith('SELECT VALUE FROM SYS.M_SYSTEM_OVERVIEW'):
+            self._rows = [('2.00.050',)]
+        elif sql.startswith('SELECT * FROM SYS.'):
+            # AFL_PACKAGES and EFFECTIVE_ROLES checks of require_pal_usable.
+            self._rows = [(1,)]
+        else:
+            self._rows = list(self.connection.rows)
+
+    def executemany(self, sql, data):
+        """
+        Record `sql`, with the number of rows of `data` it inserts.
+        """
+        self._check(sql)
+        self.connection.statements.append(sql)
+        self.connection.inserted.append(list(data))
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+    def setfetchsize(self, size):
+        pass
+
+    def close(self):
+        pass
+
+class FakeConnection(object):#pylint: disable=useless-object-inheritance
+    """
+    Stand-in for an hdbcli connection.
+
+    Attributes
+    ----------
+
+    statements : list of str
+        SQL statements executed so far, in order.
+
+    inserted : list of list
+        Rows of each executemany() call.
+
+    rows : list of tuple
+        Rows returned by any query not answered otherwise.
+
+    fail_on : list of str
+        Statements containing one of these strings raise dbapi.Error.
+    """
+    def __init__(self):
+        self.statements = []
+        self.inserted = []
+        self.rows = []
+        self.fail_on = []
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def getautocommit(self):#pylint: disable=no-self-use
+        return True
+
+    def statements_with(self, pattern):
+        """
+        Return the executed statements containing `pattern`.
+        """
+        return [sql for sql in self.statements if pattern in sql]
+
+@pytest.fixture
+def conn_context():
+    """
+    ConnectionContext over a FakeConnection, with the PAL checks passing.
+    """
+    context = ConnectionContext.__new__(ConnectionContext)
+    context.connection = FakeConnection()
+    context.pyodbc_connection = None
+    context._pal_check_passed = False#pylint: disable=protected-access
+    context.sql_tracer = SqlTrace()
+    context.last_execute_statement = None
+    return context
+
+@pytest.fixture(scope='session')
+def hana_conn_context():
+    """
+    ConnectionContext to the server of the HANA_ML_TEST_* variables.
+    """
+    missing = [name for name in _SERVER_VARIABLES if name not in os.environ]
+    if missing:
+        pytest.skip('no SAP HANA server, {} not set'.format(', '.join(missing)))
+    address, port, user, password = [os.environ[name] for name in _SERVER_VARIABLES]
+    context = ConnectionContext(address, int(port), user, password)
+    yield context
+    context.close()
@@ -0,0 +1,90 @@
+"""
+Tests of drawing from several distributions with one PAL call.
+"""
+import numpy as np
+import pytest
+from hdbcli import dbapi
+from hana_ml.algorithms.pal import random
+
+SPECS = [('normal', {'mean': 0, 'sigma': 1}),
+         ('gamma', {'shape': 2}),
+         ('poisson', {'theta': 4.0})]
+
+def _blocks(conn_context):
+    return conn_context.connection.statements_with('PAL_DISTRIBUTION_RANDOM')
+
+def test_one_block_for_all_specs(conn_context):
+    random.batch_random(conn_context, SPECS, num_random=2, seed=7)
+    blocks = _blocks(conn_context)
+    assert len(blocks) == 1
+    sql = blocks[0]
+    assert sql.startswith('DO\nBEGIN\n')
+    for i in range(len(SPECS)):
+        assert 'CALL _SYS_AFL.PAL_DISTRIBUTION_RANDOM(:dist_{0}, :params, out_{0});'.format(
+            i) in sql
+        assert 'SELECT {0} AS "SPEC_ID", "ID", "GENERATED_NUMBER" FROM :out_{0}'.format(
+            i) in sql
+    assert sql.count('CALL ') == len(SPECS)
+    assert "N'NORMAL'" in sql and "N'GAMMA'" in sql and "N'POISSON'" in sql
+    assert 'CREATE LOCAL TEMPORARY COLUMN TABLE "#DISTRIBUTION_BATCH_RESULT_' in sql
+
+def test_no_parameter_tables(conn_context):
+    random.batch_random(conn_context, SPECS, num_random=2, seed=7)
+    statements = conn_context.connection.statements
+    assert not [sql for sql in statements if sql.startswith('CREATE')]
+    assert not conn_context.connection.inserted
+
+def test_sample_many_is_gone():
+    assert not hasattr(random, 'sample_many')
+
+def test_batch_random_seed(conn_context):
+    res = random.batch_random(conn_context, SPECS, num_random=2, seed=7)
+    sql = _blocks(conn_context)[0]
+    assert "param_name[1] := N'NUM_RANDOM';\nint_value[1] := 2;" in sql
+    assert "param_name[2] := N'SEED';\nint_value[2] := 7;" in sql
+    assert res.seed == 7
+
+def test_batch_random_records_drawn_seed(conn_context):
+    res = random.batch_random(conn_context, SPECS, num_random=2)
+    assert res.seed > 0
+    assert "N'SEED';\nint_value[2] := {};".format(res.seed) in _blocks(conn_context)[0]
+
+def test_batch_random_defaults_and_validation(conn_context):
+    random.batch_random(conn_context, [('gamma', {})], num_random=2, seed=1)
+    sql = _blocks(conn_context)[0]
+    assert "SELECT N'SHAPE', N'1' FROM DUMMY UNION ALL SELECT N'SCALE', N'1' FROM DUMMY" in sql
+    with pytest.raises(ValueError):
+        random.batch_random(conn_context, [('gamma', {'shape': -1})])
+
+@pytest.mark.parametrize('specs', [
+    [],
+    [('no_such_sampler', {})],
+    [('normal',)],
+    [('normal', [0, 1])],
+    [(['normal'], {})],
+])
+def test_batch_random_bad_specs(conn_context, specs):
+    with pytest.raises(ValueError, match='Parameter specs'):
+        random.batch_random(conn_context, specs)
+
+def test_batch_random_specs_not_list(conn_context):
+    with pytest.raises(TypeError):
+        random.batch_random(conn_context, 'normal')
+
+def test_batch_random_unknown_argument(conn_context):
+    with pytest.raises(TypeError, match='mu'):
+        random.batch_random(conn_context, [('normal', {'mu': 0})])
+
+def test_batch_random_numpy(conn_context):
+    conn_context.connection.rows = [(float(i),) for i in range(6)]
+    res = random.batch_random(conn_context, SPECS, num_random=2, seed=7, output='numpy')
+    np.testing.assert_array_equal(res, [[0, 1], [2, 3], [4, 5]])
+    sql = _blocks(conn_context)[0]
+    assert 'ORDER BY "SPEC_ID", "ID"' in sql
+    assert 'CREATE LOCAL TEMPORARY' not in sql
+
+def test_batch_random_error_drops_result(conn_context):
+    conn_context.connection.fail_on = ['PAL_DISTRIBUTION_RANDOM']
+    with pytest.raises(dbapi.Error):
+        random.batch_random(conn_context, SPECS, num_random=2, seed=7)
+    assert conn_context.connection.statements_with('DROP TABLE "#DISTRIBUTION_BATCH_RESULT_')
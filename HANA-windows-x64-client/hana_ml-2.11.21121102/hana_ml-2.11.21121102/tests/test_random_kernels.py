@@ -0,0 +1,101 @@
+"""
+Tests of the numba kernels for large client-side draws.
+"""
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from hana_ml.algorithms.pal import _rng_kernels, random
+
+SIZE = 200000
+
+needs_numba = pytest.mark.skipif(not _rng_kernels.AVAILABLE, reason='numba is not installed')
+
+@pytest.fixture(autouse=True)
+def _clear_kernels():
+    random._kernels.cache_clear()#pylint: disable=protected-access
+    yield
+    random._kernels.cache_clear()#pylint: disable=protected-access
+
+def _check_moments(samples, mean, variance):
+    assert samples.dtype == np.float64
+    assert samples.shape == (SIZE,)
+    assert abs(samples.mean() - mean) < 4 * np.sqrt(variance / SIZE)
+    assert samples.var() == pytest.approx(variance, rel=0.05)
+
+@needs_numba
+@pytest.mark.parametrize('kernel, params', [
+    ('uniform', (-1.0, 3.0)),
+    ('normal', (1.0, 2.0)),
+    ('gamma', (0.5, 2.0)),
+    ('poisson', (3.0,)),
+])
+def test_same_seed_same_samples(kernel, params):
+    draw = getattr(_rng_kernels, kernel)
+    first = draw(42, SIZE, *params)
+    np.testing.assert_array_equal(first, draw(42, SIZE, *params))
+    assert not np.array_equal(first, draw(43, SIZE, *params))
+    # A shorter draw is a prefix of a longer one with the same seed.
+    np.testing.assert_array_equal(first[:1000], draw(42, 1000, *params))
+
+@needs_numba
+def test_uniform_moments():
+    samples = _rng_kernels.uniform(1, SIZE, -1.0, 3.0)
+    assert samples.min() >= -1.0 and samples.max() < 3.0
+    _check_moments(samples, 1.0, 16.0 / 12)
+
+@needs_numba
+def test_normal_moments():
+    _check_moments(_rng_kernels.normal(1, SIZE, 1.0, 2.0), 1.0, 4.0)
+
+@needs_numba
+@pytest.mark.parametrize('shape', [0.5, 1.0, 3.0])
+def test_gamma_moments(shape):
+    samples = _rng_kernels.gamma(2, SIZE, shape, 2.0)
+    assert samples.min() >= 0
+    _check_moments(samples, shape * 2.0, shape * 4.0)
+
+@needs_numba
+@pytest.mark.parametrize('theta', [3.0, 50.0])
+def test_poisson_moments(theta):
+    samples = _rng_kernels.poisson(3, SIZE, theta)
+    np.testing.assert_array_equal(samples, np.round(samples))
+    assert samples.min() >= 0
+    _check_moments(samples, theta, theta)
+
+def test_numpy_without_numba(conn_context, monkeypatch):
+    monkeypatch.setattr(_rng_kernels, 'AVAILABLE', False)
+    monkeypatch.setattr(_rng_kernels, 'NUM_THREADS', 4)
+    assert random._kernels() is None#pylint: disable=protected-access
+    size = random._KERNEL_MIN_SIZE#pylint: disable=protected-access
+    samples = random.normal(conn_context, mean=1, sigma=2, num_random=size, seed=5,
+                            execute='client', output='numpy')
+    np.testing.assert_array_equal(samples, np.random.default_rng(5).normal(1, 2, size))
+
+@needs_numba
+def test_numpy_on_one_thread(monkeypatch):
+    monkeypatch.setattr(_rng_kernels, 'NUM_THREADS', 1)
+    assert random._kernels() is None#pylint: disable=protected-access
+
+@needs_numba
+def test_kernels_from_cutoff(conn_context, monkeypatch):
+    monkeypatch.setattr(_rng_kernels, 'NUM_THREADS', 4)
+    assert random._kernels() is _rng_kernels#pylint: disable=protected-access
+    size = random._KERNEL_MIN_SIZE#pylint: disable=protected-access
+    samples = random.normal(conn_context, mean=1, sigma=2, num_random=size, seed=5,
+                            execute='client', output='numpy')
+    np.testing.assert_array_equal(samples, _rng_kernels.normal(5, size, 1.0, 2.0))
+    below = random.normal(conn_context, mean=1, sigma=2, num_random=size - 1, seed=5,
+                          execute='client', output='numpy')
+    np.testing.assert_array_equal(below, np.random.default_rng(5).normal(1, 2, size - 1))
+
+def test_numba_imported_lazily():
+    src = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src')
+    code = ('import sys; sys.path.insert(0, {!r}); '
+            'import hana_ml.algorithms.pal.random; '
+            'print("numba" in sys.modules)').format(src)
+    out = subprocess.run([sys.executable, '-c', code], stdout=subprocess.PIPE,
+                         check=True, universal_newlines=True).stdout
+    assert out.strip().splitlines()[-1] == 'False'
@@ -0,0 +1,303 @@
+"""
+Tests of mcmc().
+"""
+import re
+
+import numpy as np
+import pytest
+from hdbcli import dbapi
+from hana_ml.algorithms.pal import random
+
+def _mcmc_blocks(conn_context):
+    return conn_context.connection.statements_with('_SYS_AFL.PAL_MCMC')
+
+def _chain_seeds(sql):
+    return [int(seed) for seed in re.findall(r"SELECT N'RANDOM_SEED', (\d+), NULL, NULL", sql)]
+
+def test_single_chain(conn_context):
+    res = random.mcmc(conn_context, 'normal', mu=0, sigma=1, chain_iter=50, random_state=3)
+    blocks = _mcmc_blocks(conn_context)
+    assert len(blocks) == 1
+    sql = blocks[0]
+    assert "param_name[5] := N'RANDOM_SEED';\nint_value[5] := 3;" in sql
+    assert "string_value[2] := N'{\"MU\":[0],\"SIGMA\":[1]}';" in sql
+    # WARMUP defaults to half of ITER.
+    assert "param_name[6] := N'WARMUP';\nint_value[6] := 25;" in sql
+    assert sql.count('CALL _SYS_AFL.PAL_MCMC(') == 1
+    assert 'CHAIN_ID' not in sql
+    assert res.select_statement.startswith('SELECT * FROM "#PAL_MCMC_RESULT_TBL_')
+
+def test_chains_in_one_block(conn_context):
+    random.mcmc(conn_context, 'normal', chain_iter=50, num_chains=3, random_state=5)
+    blocks = _mcmc_blocks(conn_context)
+    assert len(blocks) == 1
+    sql = blocks[0]
+    for chain in range(3):
+        assert 'CALL _SYS_AFL.PAL_MCMC(:params_{0}, out_{0});'.format(chain) in sql
+        assert 'SELECT {0} AS "CHAIN_ID", out_{0}.* FROM :out_{0} AS out_{0}'.format(
+            chain) in sql
+    # The seed rows are per chain, not in the shared parameters.
+    assert ":= N'RANDOM_SEED'" not in sql
+    seeds = _chain_seeds(sql)
+    assert seeds == random._chain_seeds(5, 3)#pylint: disable=protected-access
+    assert len(set(seeds)) == 3
+    assert all(0 < seed < 2**31 for seed in seeds)
+
+def test_chain_seeds_reproducible(conn_context):
+    for _ in range(2):
+        random.mcmc(conn_context, 'normal', chain_iter=50, num_chains=2, random_state=5)
+    first, second = [_chain_seeds(sql) for sql in _mcmc_blocks(conn_context)]
+    assert first == second
+    random.mcmc(conn_context, 'normal', chain_iter=50, num_chains=2, random_state=6)
+    assert _chain_seeds(_mcmc_blocks(conn_context)[-1]) != first
+
+def test_chain_seeds_without_random_state(conn_context):
+    random.mcmc(conn_context, 'normal', chain_iter=50, num_chains=2)
+    assert len(set(_chain_seeds(_mcmc_blocks(conn_context)[0]))) == 2
+
+@pytest.mark.parametrize('num_chains', [0, -2])
+def test_bad_num_chains(conn_context, num_chains):
+    with pytest.raises(ValueError, match='num_chains'):
+        random.mcmc(conn_context, 'normal', num_chains=num_chains)
+
+def test_num_chains_type(conn_context):
+    with pytest.raises(TypeError):
+        random.mcmc(conn_context, 'normal', num_chains=1.5)
+
+@pytest.mark.parametrize('num_chains', [1, 3])
+def test_error_drops_tables(conn_context, num_chains):
+    conn_context.connection.fail_on = ['_SYS_AFL.PAL_MCMC']
+    with pytest.raises(dbapi.Error):
+        random.mcmc(conn_context, 'normal', num_chains=num_chains)
+    drops = conn_context.connection.statements_with('DROP TABLE')
+    # Only the single chain call creates a parameter table.
+    assert bool([sql for sql in drops if '#PAL_MCMC_PARAMETER_TBL_' in sql]) == (num_chains == 1)
+    assert [sql for sql in drops if '#PAL_MCMC_RESULT_TBL_' in sql]
+
+SESSION_RESULT = '"#PAL_MCMC_RESULT_TBL_SESSION_1_1"'
+
+def test_session_cache_reuses_tables(conn_context):
+    first = random.mcmc(conn_context, 'normal', chain_iter=50, random_state=1,
+                        session_cache=True)
+    conn_context.connection.rows = [(0, 0.5), (1, 1.5)]
+    second = random.mcmc(conn_context, 'normal', sigma=2, chain_iter=50, random_state=2,
+                         session_cache=True)
+    assert first.select_statement == second.select_statement == (
+        'SELECT * FROM ' + SESSION_RESULT)
+    create, reuse = _mcmc_blocks(conn_context)
+    assert 'CREATE LOCAL TEMPORARY COLUMN TABLE ' + SESSION_RESULT in create
+    # Anonymous blocks cannot use local temporary tables: the block only
+    # selects the samples, which are written back by separate statements.
+    assert 'CREATE' not in reuse and SESSION_RESULT not in reuse
+    assert reuse.endswith('SELECT * FROM :out_0;\nEND\n')
+    statements = conn_context.connection.statements
+    refill = statements[statements.index(reuse) + 1:statements.index(reuse) + 3]
+    assert refill == ['TRUNCATE TABLE ' + SESSION_RESULT,
+                      'INSERT INTO {} VALUES (?, ?)'.format(SESSION_RESULT)]
+    assert conn_context.connection.inserted == [[(0, 0.5), (1, 1.5)]]
+    assert _chain_seeds(reuse) == [2]
+    assert '"SIGMA":[2]' in reuse
+
+def test_session_cache_keyed_by_layout(conn_context):
+    random.mcmc(conn_context, 'normal', chain_iter=50, session_cache=True)
+    random.mcmc(conn_context, 'normal', chain_iter=50, num_chains=2, session_cache=True)
+    random.mcmc(conn_context, 'multinormal', mu=[0, 0], sigma=[1, 0, 0, 1],
+                chain_iter=50, session_cache=True)
+    blocks = _mcmc_blocks(conn_context)
+    assert not [sql for sql in blocks if 'TRUNCATE' in sql]
+    for name in ['1_1', '1_2', '2_1']:
+        assert [sql for sql in blocks if '"#PAL_MCMC_RESULT_TBL_SESSION_{}"'.format(name) in sql]
+
+def test_session_cache_per_connection(conn_context):
+    random.mcmc(conn_context, 'normal', chain_iter=50, session_cache=True)
+    other = type(conn_context).__new__(type(conn_context))
+    other.__dict__.update(conn_context.__dict__)
+    del other._mcmc_session_tables#pylint: disable=protected-access
+    random.mcmc(other, 'normal', chain_iter=50, session_cache=True)
+    assert not [sql for sql in _mcmc_blocks(conn_context) if 'TRUNCATE' in sql]
+
+def test_session_cache_recreates_lost_table(conn_context):
+    random.mcmc(conn_context, 'normal', chain_iter=50, session_cache=True)
+    conn_context.connection.fail_on = ['TRUNCATE TABLE']
+    random.mcmc(conn_context, 'normal', chain_iter=50, session_cache=True)
+    assert conn_context.connection.statements_with('DROP TABLE ' + SESSION_RESULT)
+    recreate = _mcmc_blocks(conn_context)[-1]
+    assert 'CREATE LOCAL TEMPORARY COLUMN TABLE ' + SESSION_RESULT in recreate
+    conn_context.connection.fail_on = []
+    del conn_context.connection.statements[:]
+    random.mcmc(conn_context, 'normal', chain_iter=50, session_cache=True)
+    assert conn_context.connection.statements_with('TRUNCATE TABLE ' + SESSION_RESULT)
+    assert not conn_context.connection.statements_with('CREATE')
+
+def test_session_cache_lost_chains_table(conn_context):
+    random.mcmc(conn_context, 'normal', chain_iter=50, num_chains=2, session_cache=True)
+    conn_context.connection.fail_on = ['TRUNCATE TABLE']
+    random.mcmc(conn_context, 'normal', chain_iter=50, num_chains=2, session_cache=True)
+    assert conn_context.connection.statements_with(
+        'DROP TABLE "#PAL_MCMC_RESULT_TBL_SESSION_1_2"')
+    assert not conn_context.connection.statements_with('#PAL_MCMC_PARAMETER_TBL_')
+
+@pytest.mark.hana
+def test_session_cache_refill_on_server(hana_conn_context, caplog):
+    for seed in (1, 2):
+        cached = random.mcmc(hana_conn_context, 'normal', chain_iter=50, random_state=seed,
+                             session_cache=True).collect()
+    assert 'Reusing' not in caplog.text
+    fresh = random.mcmc(hana_conn_context, 'normal', chain_iter=50, random_state=2).collect()
+    assert cached.equals(fresh)
+
+def test_lazy_skips_schema_lookup(conn_context):
+    random.mcmc(conn_context, 'normal', chain_iter=50)
+    eager = len(conn_context.connection.statements_with('CURRENT_SCHEMA'))
+    del conn_context.connection.statements[:]
+    res = random.mcmc(conn_context, 'normal', chain_iter=50, lazy=True)
+    assert len(conn_context.connection.statements_with('CURRENT_SCHEMA')) < eager
+    assert res.source_table is None
+
+def test_mcmc_batch_one_block(conn_context):
+    grid = [dict(distribution='normal', mu=0.0, sigma=sigma, chain_iter=50, random_state=1)
+            for sigma in (0.5, 1.0, 2.0)]
+    res = random.mcmc_batch(conn_context, grid)
+    blocks = _mcmc_blocks(conn_context)
+    assert len(blocks) == 1
+    sql = blocks[0]
+    shared, calls = sql.split('params = UNNEST(:param_name, :int_value, :double_value, '
+                              ':string_value);\n')
+    for name in ['DISTRIBUTION_NAME', 'DIMENSION', 'ITER', 'RANDOM_SEED', 'WARMUP']:
+        assert ":= N'{}';".format(name) in shared
+    assert 'DISTRIBUTION_PARAM' not in shared
+    for i, sigma in enumerate((0.5, 1.0, 2.0)):
+        assert ('params_{0} = SELECT * FROM :params UNION ALL SELECT N\'DISTRIBUTION_PARAM\', '
+                'NULL, NULL, N\'{{"MU":[0.0],"SIGMA":[{1}]}}\' FROM DUMMY;\n'
+                'CALL _SYS_AFL.PAL_MCMC(:params_{0}, out_{0});').format(i, sigma) in calls
+        assert 'SELECT {0} AS "PARAM_SET_ID", out_{0}.* FROM :out_{0} AS out_{0}'.format(
+            i) in calls
+    assert 'CREATE LOCAL TEMPORARY COLUMN TABLE "#PAL_MCMC_RESULT_TBL_' in calls
+    assert sorted(res) == [0, 1, 2]
+    assert res[2].select_statement.endswith('WHERE "PARAM_SET_ID" = 2')
+
+def test_mcmc_batch_per_set_rows(conn_context):
+    random.mcmc_batch(conn_context, [
+        dict(distribution='normal', random_state=1),
+        dict(distribution='student_t', nu=3, random_state=2, thin=2)])
+    sql = _mcmc_blocks(conn_context)[0]
+    assert _chain_seeds(sql) == [1, 2]
+    assert "SELECT N'DISTRIBUTION_NAME', NULL, NULL, N'student_t' FROM DUMMY" in sql
+    assert "SELECT N'THIN', 2, NULL, NULL FROM DUMMY" in sql
+    assert ":= N'THIN';" not in sql
+
+@pytest.mark.parametrize('grid', [
+    [],
+    [{}],
+    ['normal'],
+    [dict(distribution='normal'), None],
+])
+def test_mcmc_batch_bad_grid(conn_context, grid):
+    with pytest.raises(ValueError, match='param_grid'):
+        random.mcmc_batch(conn_context, grid)
+
+def test_mcmc_batch_dimensions_differ(conn_context):
+    with pytest.raises(ValueError):
+        random.mcmc_batch(conn_context, [
+            dict(distribution='normal'),
+            dict(distribution='multinormal', mu=[0, 0], sigma=[1, 0, 0, 1])])
+
+@pytest.mark.parametrize('name', ['num_chains', 'session_cache', 'local', 'sigmaa'])
+def test_mcmc_batch_unknown_argument(conn_context, name):
+    with pytest.raises(TypeError, match=name):
+        random.mcmc_batch(conn_context, [{'distribution': 'normal', name: 1}])
+
+def test_mcmc_batch_validates_each_set(conn_context):
+    with pytest.raises(TypeError):
+        random.mcmc_batch(conn_context, [dict(distribution='normal'),
+                                         dict(distribution='normal', chain_iter=1.5)])
+    assert not _mcmc_blocks(conn_context)
+
+def test_mcmc_batch_error_drops_result(conn_context):
+    conn_context.connection.fail_on = ['_SYS_AFL.PAL_MCMC']
+    with pytest.raises(dbapi.Error):
+        random.mcmc_batch(conn_context, [dict(distribution='normal')] * 2)
+    drops = conn_context.connection.statements_with('DROP TABLE')
+    assert [sql for sql in drops if '#PAL_MCMC_RESULT_TBL_' in sql]
+    # The parameter sets are table variables of the block, not a table.
+    assert not conn_context.connection.statements_with('#PAL_MCMC_PARAMETER_TBL_')
+
+@pytest.fixture
+def uploads(monkeypatch):
+    """
+    Samples passed to _upload_samples, which the fake connection cannot run.
+    """
+    calls = []
+    def upload(conn_context, dist_name, samples, columns):#pylint: disable=unused-argument
+        calls.append((dist_name, samples, columns))
+        return samples
+    monkeypatch.setattr(random, '_upload_samples', upload)
+    return calls
+
+def test_local_skips_pal(conn_context, uploads):
+    samples = random.mcmc(conn_context, 'student_t', mu=0, sigma=1, nu=1, chain_iter=50,
+                          thin=10, random_state=1, local=True)
+    # Not even the PAL availability check is run.
+    assert not conn_context.connection.statements
+    [(dist_name, uploaded, columns)] = uploads
+    assert dist_name == 'PAL_MCMC' and columns == ['SAMPLES']
+    assert uploaded is samples and samples.dtype == np.float64
+
+def test_local_sample_count(conn_context, uploads):
+    # The count of the mcmc() example, generated by PAL.
+    samples = random.mcmc(conn_context, 'student_t', mu=0, sigma=1, nu=1, chain_iter=50,
+                          thin=10, init_radius=0, local=True)
+    assert len(samples) == 6
+
+LOCAL_COUNT_CASES = [dict(chain_iter=50, thin=10), dict(chain_iter=50), dict(),
+                     dict(chain_iter=100, warmup=10, thin=3), dict(chain_iter=10, warmup=10)]
+
+@pytest.mark.hana
+@pytest.mark.parametrize('kwargs', LOCAL_COUNT_CASES)
+def test_local_sample_count_matches_pal(hana_conn_context, kwargs):
+    pal = random.mcmc(hana_conn_context, 'normal', random_state=1, **kwargs).count()
+    local = random.mcmc(hana_conn_context, 'normal', random_state=1, local=True,
+                        **kwargs).count()
+    assert local == pal
+
+def test_local_seeded(conn_context, uploads):
+    first, second, other = [random.mcmc(conn_context, 'normal', mu=1, sigma=2, chain_iter=60,
+                                        random_state=seed, local=True)
+                            for seed in (4, 4, 5)]
+    np.testing.assert_array_equal(first, second)
+    np.testing.assert_array_equal(first, np.random.default_rng(4).normal(1, 2, 61))
+    assert not np.array_equal(first, other)
+
+def test_local_independent_draws(conn_context, uploads):
+    samples = random.mcmc(conn_context, 'normal', mu=1, sigma=2, chain_iter=40000,
+                          random_state=7, local=True)
+    assert abs(samples.mean() - 1) < 0.05
+    assert samples.var() == pytest.approx(4, rel=0.05)
+    # Independent draws, unlike a Markov chain, have no lag-1 autocorrelation.
+    assert abs(np.corrcoef(samples[:-1], samples[1:])[0, 1]) < 0.03
+
+@pytest.mark.parametrize('kwargs', [dict(num_chains=2), dict(session_cache=True)])
+def test_local_exclusive_options(conn_context, uploads, kwargs):
+    with pytest.raises(ValueError, match='local cannot be combined'):
+        random.mcmc(conn_context, 'normal', local=True, **kwargs)
+
+@pytest.mark.parametrize('distribution, kwargs', [
+    ('skew_normal', {}),
+    ('multinormal', dict(mu=[0, 0], sigma=[1, 0, 0, 1])),
+])
+def test_local_unsupported_distribution(conn_context, uploads, distribution, kwargs):
+    with pytest.raises(ValueError, match='not supported for the {}'.format(distribution)):
+        random.mcmc(conn_context, distribution, local=True, **kwargs)
+    assert not uploads
+
+@pytest.mark.parametrize('name, pal_name', [
+    ('chain_iter', 'ITER'), ('warmup', 'WARMUP'), ('thin', 'THIN'),
+    ('max_depth', 'MAX_TREEDEPTH'), ('adapt_init_buffer', 'ADAPT_INIT_BUFFER'),
+    ('adapt_term_buffer', 'ADAPT_TERM_BUFFER'), ('adapt_window', 'ADAPT_WINDOW'),
+])
+def test_integer_arguments(conn_context, name, pal_name):
+    with pytest.raises(TypeError, match="Parameter '{}' must be of type int".format(name)):
+        random.mcmc(conn_context, 'normal', **{name: 2.5})
+    random.mcmc(conn_context, 'normal', **{name: 20})
+    assert re.search(r"N'{}';\nint_value\[\d+\] := 20;".format(pal_name),
+                     _mcmc_blocks(conn_context)[-1])
@@ -0,0 +1,86 @@
+"""
+Tests of multinomial().
+"""
+import numpy as np
+import pytest
+from hdbcli import dbapi
+from hana_ml.algorithms.pal import random
+
+PVALS = (0.1, 0.3, 0.6)
+
+def test_parameter_table_reused(conn_context):
+    for _ in range(3):
+        random.multinomial(conn_context, n=10, pvals=PVALS, num_random=5, seed=1)
+    connection = conn_context.connection
+    assert len(connection.statements_with('CREATE LOCAL TEMPORARY COLUMN TABLE '
+                                          '"#PAL_RND_MULTINOMIAL_3_1"')) == 1
+    assert len(connection.statements_with('TRUNCATE TABLE "#PAL_RND_MULTINOMIAL_3_1"')) == 2
+    assert connection.inserted == [[(10,) + PVALS]] * 3
+    assert not connection.statements_with('#PAL_RND_MULTINOMIAL_3_2')
+
+def test_parameter_table_keyed_by_categories(conn_context):
+    random.multinomial(conn_context, n=10, pvals=PVALS, num_random=5, seed=1)
+    random.multinomial(conn_context, n=10, pvals=(0.5, 0.5), num_random=5, seed=1)
+    assert conn_context.connection.statements_with('CREATE LOCAL TEMPORARY COLUMN TABLE '
+                                                   '"#PAL_RND_MULTINOMIAL_2_2"')
+    assert not conn_context.connection.statements_with('TRUNCATE')
+
+def test_failed_refill_drops_table(conn_context):
+    random.multinomial(conn_context, n=10, pvals=PVALS, num_random=5, seed=1)
+    conn_context.connection.fail_on = ['TRUNCATE TABLE']
+    with pytest.raises(dbapi.Error):
+        random.multinomial(conn_context, n=10, pvals=PVALS, num_random=5, seed=1)
+    assert conn_context.connection.statements_with('DROP TABLE "#PAL_RND_MULTINOMIAL_3_1"')
+    conn_context.connection.fail_on = []
+    random.multinomial(conn_context, n=10, pvals=PVALS, num_random=5, seed=1)
+    # The dropped table is not handed out again.
+    assert conn_context.connection.statements_with('CREATE LOCAL TEMPORARY COLUMN TABLE '
+                                                   '"#PAL_RND_MULTINOMIAL_3_2"')
+
+def test_failed_call_drops_tables(conn_context):
+    conn_context.connection.fail_on = ['PAL_DISTRIBUTION_RANDOM_MULTIVARIATE']
+    with pytest.raises(dbapi.Error):
+        random.multinomial(conn_context, n=10, pvals=PVALS, num_random=5, seed=1)
+    assert conn_context.connection.statements_with('DROP TABLE "#PAL_RND_MULTINOMIAL_3_1"')
+    assert conn_context.connection.statements_with('DROP TABLE "#MULTINOMIAL_RESULT_')
+
+@pytest.mark.parametrize('n, pvals', [(10, PVALS), (2, (0.1, 0.2, 0.3, 0.4)), (0, PVALS)])
+def test_client_draws(conn_context, n, pvals):
+    samples = random.multinomial(conn_context, n=n, pvals=pvals, num_random=2000, seed=3,
+                                 execute='client', output='numpy')
+    assert samples.shape == (2000, len(pvals))
+    np.testing.assert_array_equal(samples.sum(axis=1), n)
+    probs = np.asarray(pvals) / sum(pvals)
+    np.testing.assert_allclose(samples.mean(axis=0), n * probs, atol=0.1 * max(n, 1))
+    np.testing.assert_array_equal(
+        samples, random.multinomial(conn_context, n=n, pvals=pvals, num_random=2000, seed=3,
+                                    execute='client', output='numpy'))
+    assert not conn_context.connection.statements
+
+def test_client_unnormalized_pvals(conn_context):
+    samples = random.multinomial(conn_context, n=50, pvals=(1, 3), num_random=4000, seed=3,
+                                 execute='client', output='numpy')
+    assert samples[:, 1].mean() == pytest.approx(37.5, rel=0.02)
+
+@pytest.mark.parametrize('num_random', [0, 4])
+def test_client_pandas(conn_context, num_random):
+    res = random.multinomial(conn_context, n=5, pvals=PVALS, num_random=num_random, seed=3,
+                             execute='client', output='pandas')
+    assert list(res.columns) == ['ID', 'RANDOM_P1', 'RANDOM_P2', 'RANDOM_P3']
+    assert len(res) == num_random
+    assert list(res['ID']) == list(range(num_random))
+
+@pytest.mark.parametrize('pvals', [(0, 0), (0.0, 0.0, 0.0)])
+def test_all_zero_pvals(conn_context, pvals):
+    with pytest.raises(ValueError, match='at least one value greater than zero'):
+        random.multinomial(conn_context, n=5, pvals=pvals, execute='client')
+
+@pytest.mark.parametrize('pvals', [(), (0.5, -0.1), (0.5, float('nan')), (0.5, float('inf')),
+                                   ('a', 'b'), ((0.5,), (0.5,)), (0.5, None)])
+def test_bad_pvals(conn_context, pvals):
+    with pytest.raises(ValueError, match='tuple of non-negative floats and ints'):
+        random.multinomial(conn_context, n=5, pvals=pvals, execute='client')
+
+def test_pvals_not_tuple(conn_context):
+    with pytest.raises(TypeError):
+        random.multinomial(conn_context, n=5, pvals=[0.5, 0.5])
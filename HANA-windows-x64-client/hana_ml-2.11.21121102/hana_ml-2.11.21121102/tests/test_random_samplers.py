@@ -0,0 +1,162 @@
+"""
+Tests of the univariate samplers.
+"""
+import inspect
+
+import numpy as np
+import pytest
+from hana_ml.algorithms.pal import random
+
+#pylint: disable=protected-access
+
+def test_validation_memoized():
+    random._validate_memoized.cache_clear()
+    first = random._validate('GAMMA', 2.0, 3.0)
+    assert random._validate('GAMMA', 2.0, 3.0) is first
+    assert random._validate_memoized.cache_info().hits == 1
+    assert first == (('DISTRIBUTIONNAME', 'GAMMA'), ('SHAPE', 2.0), ('SCALE', 3.0))
+
+def test_invalid_values_not_memoized():
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            random._validate('GAMMA', -1.0, 3.0)
+
+@pytest.mark.parametrize('shape', [[2.0], {'shape': 2.0}])
+def test_unhashable_argument(conn_context, shape):
+    with pytest.raises(TypeError, match="Parameter 'shape' must be of type float"):
+        random.gamma(conn_context, shape=shape, num_random=5, execute='client')
+
+SAMPLERS = sorted(random._SAMPLER_DISTRIBUTIONS) + ['multinomial']
+
+@pytest.mark.parametrize('sampler', SAMPLERS)
+def test_server_by_default(sampler):
+    parameters = inspect.signature(getattr(random, sampler)).parameters
+    assert parameters['execute'].default == 'server'
+
+def _pal_calls(conn_context):
+    return conn_context.connection.statements_with('_SYS_AFL.PAL_DISTRIBUTION_RANDOM')
+
+def test_small_draw_runs_on_server(conn_context):
+    conn_context.connection.rows = [(0.5,)] * 5
+    samples = random.normal(conn_context, num_random=5, seed=2, output='numpy')
+    assert len(_pal_calls(conn_context)) == 1
+    np.testing.assert_array_equal(samples, [0.5] * 5)
+
+def test_auto_small_draw_on_client(conn_context):
+    samples = random.normal(conn_context, num_random=5, seed=2, output='numpy', execute='auto')
+    assert not _pal_calls(conn_context)
+    np.testing.assert_array_equal(samples, np.random.default_rng(2).normal(0, 1, 5))
+
+@pytest.mark.parametrize('num_random, output', [
+    (random._CLIENT_MAX_BYTES // 8 + 1, 'numpy'),
+    (5, 'dataframe'),
+])
+def test_auto_on_server(conn_context, num_random, output):
+    random.normal(conn_context, num_random=num_random, seed=2, output=output, execute='auto')
+    assert len(_pal_calls(conn_context)) == 1
+
+NUM_CLIENT = 200000
+
+def _client_draw(conn_context, sampler, kwargs):
+    return getattr(random, sampler)(conn_context, num_random=NUM_CLIENT, seed=5,
+                                    execute='client', output='numpy', **kwargs)
+
+def _check_moments(samples, mean, var):
+    assert samples.mean() == pytest.approx(mean, abs=5 * np.sqrt(var / len(samples)))
+    assert samples.var() == pytest.approx(var, rel=0.05)
+
+# Moments of the distributions as PAL defines them: geometric counts the
+# failures before the first success, negative_binomial the failures before
+# the n-th success, weibull scales the standard distribution by `scale`, and
+# pert is a beta distribution over [minimum, maximum] weighted by `scale`.
+PAL_DEFINITIONS = [
+    ('geometric', {'p': 0.25}, 0.75 / 0.25, 0.75 / 0.25**2),
+    ('negative_binomial', {'n': 3, 'p': 0.4}, 3 * 0.6 / 0.4, 3 * 0.6 / 0.4**2),
+    ('weibull', {'shape': 2, 'scale': 3}, 3 * np.sqrt(np.pi) / 2, 9 * (1 - np.pi / 4)),
+    ('pert', {'minimum': 1, 'mode': 2, 'maximum': 5, 'scale': 4},
+     (1 + 4 * 2 + 5) / 6.0, (7 / 3.0 - 1) * (5 - 7 / 3.0) / 7),
+]
+
+@pytest.mark.parametrize('sampler, kwargs, mean, var', PAL_DEFINITIONS)
+def test_client_matches_pal_definition(conn_context, sampler, kwargs, mean, var):
+    _check_moments(_client_draw(conn_context, sampler, kwargs), mean, var)
+
+@pytest.mark.parametrize('sampler', ['geometric', 'negative_binomial'])
+def test_client_counts_failures(conn_context, sampler):
+    # Zero failures is possible, unlike in a count of trials.
+    samples = _client_draw(conn_context, sampler, {'p': 0.9})
+    assert samples.min() == 0
+    assert np.mean(samples == 0) == pytest.approx(0.9, abs=0.01)
+
+def test_client_pert_bounds(conn_context):
+    samples = _client_draw(conn_context, 'pert', {'minimum': 1, 'mode': 2, 'maximum': 5})
+    assert samples.min() >= 1 and samples.max() <= 5
+    # The mode lies in the most populated bin.
+    counts, edges = np.histogram(samples, bins=8, range=(1, 5))
+    assert edges[np.argmax(counts)] <= 2 <= edges[np.argmax(counts) + 1]
+
+EULER_GAMMA = 0.5772156649015329
+
+# Mean and variance of the draws of every other _CLIENT_SAMPLERS entry, with
+# distinct parameter values so that swapping two of them is caught.
+CLIENT_MOMENTS = [
+    ('bernoulli', {'p': 0.3}, 0.3, 0.21),
+    ('beta', {'a': 2, 'b': 5}, 2 / 7.0, 10 / (49 * 8.0)),
+    ('binomial', {'n': 10, 'p': 0.3}, 3.0, 2.1),
+    ('chi_squared', {'dof': 4}, 4.0, 8.0),
+    ('exponential', {'lamb': 4}, 0.25, 0.0625),
+    ('gumbel', {'location': 1, 'scale': 2}, 1 + 2 * EULER_GAMMA, 4 * np.pi**2 / 6),
+    ('f', {'dof1': 5, 'dof2': 20}, 20 / 18.0, 2 * 400 * 23 / (5 * 18**2 * 16.0)),
+    ('gamma', {'shape': 2, 'scale': 3}, 6.0, 18.0),
+    ('lognormal', {'mean': 0.5, 'sigma': 0.5}, np.exp(0.625),
+     (np.exp(0.25) - 1) * np.exp(1.25)),
+    ('normal', {'mean': 1, 'sigma': 2}, 1.0, 4.0),
+    ('poisson', {'theta': 3.0}, 3.0, 3.0),
+    ('student_t', {'dof': 10}, 0.0, 1.25),
+    ('uniform', {'low': 1, 'high': 3}, 2.0, 1 / 3.0),
+]
+
+@pytest.mark.parametrize('sampler, kwargs, mean, var', CLIENT_MOMENTS)
+def test_client_moments(conn_context, sampler, kwargs, mean, var):
+    _check_moments(_client_draw(conn_context, sampler, kwargs), mean, var)
+
+def test_client_cauchy_quartiles(conn_context):
+    # The cauchy distribution has no moments; its quartiles are
+    # location -/+ scale.
+    samples = _client_draw(conn_context, 'cauchy', {'location': 1, 'scale': 2})
+    np.testing.assert_allclose(np.percentile(samples, [25, 50, 75]), [-1, 1, 3], atol=0.05)
+
+def test_client_samplers_all_checked():
+    checked = [case[0] for case in CLIENT_MOMENTS + PAL_DEFINITIONS] + ['cauchy']
+    assert sorted(random._SAMPLER_DISTRIBUTIONS[name] for name in checked) == sorted(
+        random._CLIENT_SAMPLERS)
+
+def test_normal_default_sigma(conn_context):
+    _check_moments(_client_draw(conn_context, 'normal', {'mean': 1, 'sigma': None}), 1.0, 1.0)
+    view = random.normal(conn_context, sigma=None, num_random=3, execute='view')
+    assert '(0.0) + (1.0) * SQRT(' in view.select_statement
+    random.normal(conn_context, sigma=None, num_random=3, seed=1)
+    # PAL applies the same default to an unset SD and VARIANCE.
+    sql = _pal_calls(conn_context)[0]
+    assert "N'VARIANCE', NULL" in sql and "N'SD', NULL" in sql
+
+BAD_SCALES = [
+    ({'sigma': 0}, 'sigma should be greater than zero'),
+    ({'sigma': -1.5}, 'sigma should be greater than zero'),
+    ({'variance': 0}, 'variance should be greater than zero'),
+    ({'variance': -2.0}, 'variance should be greater than zero'),
+    ({'sigma': 1, 'variance': 1}, 'cannot be used together'),
+]
+
+@pytest.mark.parametrize('execute', ['server', 'client', 'auto', 'view'])
+@pytest.mark.parametrize('kwargs, match', BAD_SCALES)
+def test_bad_normal_scale(conn_context, execute, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        random.normal(conn_context, num_random=3, execute=execute, **kwargs)
+    assert not _pal_calls(conn_context)
+
+@pytest.mark.parametrize('kwargs, match', BAD_SCALES)
+def test_batch_random_bad_normal_scale(conn_context, kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        random.batch_random(conn_context, [('normal', kwargs)], num_random=3)
+    assert not _pal_calls(conn_context)
@@ -0,0 +1,91 @@
+"""
+Tests of the per-thread seed sequences of seed_stream().
+"""
+import threading
+
+import numpy as np
+import pytest
+from hana_ml.algorithms.pal import random
+
+@pytest.fixture(autouse=True)
+def _reset_stream():
+    yield
+    random.seed_stream(None)
+
+def _draw(conn_context, seed=None):
+    return random.normal(conn_context, num_random=5, seed=seed, execute='client',
+                         output='numpy')
+
+def test_same_stream_reproduces_samples(conn_context):
+    random.seed_stream(base_seed=2021, stream=3)
+    first = [_draw(conn_context) for _ in range(3)]
+    random.seed_stream(base_seed=2021, stream=3)
+    second = [_draw(conn_context) for _ in range(3)]
+    np.testing.assert_array_equal(first, second)
+    assert not np.array_equal(first[0], first[1])
+
+def test_streams_differ():
+    seeds = set()
+    for stream in range(4):
+        random.seed_stream(base_seed=2021, stream=stream)
+        seeds.add(random._resolve_seed(None))#pylint: disable=protected-access
+    assert len(seeds) == 4
+
+def test_explicit_seed_bypasses_stream(conn_context):
+    random.seed_stream(base_seed=2021)
+    expected = _draw(conn_context)
+    random.seed_stream(base_seed=2021)
+    np.testing.assert_array_equal(_draw(conn_context, seed=9),
+                                  np.random.default_rng(9).normal(0, 1, 5))
+    # The explicit seed does not advance the stream.
+    np.testing.assert_array_equal(_draw(conn_context), expected)
+
+def test_streams_are_per_thread(conn_context):
+    def worker(stream, out):
+        random.seed_stream(base_seed=7, stream=stream)
+        out[stream] = [_draw(conn_context) for _ in range(2)]
+    threaded = {}
+    threads = [threading.Thread(target=worker, args=(stream, threaded)) for stream in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    for stream in range(3):
+        sequential = {}
+        worker(stream, sequential)
+        np.testing.assert_array_equal(threaded[stream], sequential[stream])
+
+def test_stream_seed_sent_to_pal(conn_context):
+    random.seed_stream(base_seed=11)
+    expected = random._resolve_seed(None)#pylint: disable=protected-access
+    random.seed_stream(base_seed=11)
+    res = random.normal(conn_context, num_random=2)
+    assert res.seed == expected
+    sql = conn_context.connection.statements_with('PAL_DISTRIBUTION_RANDOM')[0]
+    assert "N'SEED';\nint_value[2] := {};".format(expected) in sql
+
+def test_reset_stream():
+    random.seed_stream(base_seed=1)
+    random.seed_stream(None)
+    assert random._seed_streams.state is None#pylint: disable=protected-access
+
+def test_pandas_records_drawn_seed(conn_context):
+    res = random.normal(conn_context, num_random=5, execute='client', output='pandas')
+    assert res.attrs['seed'] > 0
+    again = random.normal(conn_context, num_random=5, seed=res.attrs['seed'], execute='client',
+                          output='numpy')
+    np.testing.assert_array_equal(res['GENERATED_NUMBER'], again)
+
+def test_server_pandas_records_drawn_seed(conn_context):
+    conn_context.connection.rows = [(0, 0.5), (1, 1.5)]
+    res = random.normal(conn_context, num_random=2, output='pandas')
+    sql = conn_context.connection.statements_with('PAL_DISTRIBUTION_RANDOM')[0]
+    assert "N'SEED';\nint_value[2] := {};".format(res.attrs['seed']) in sql
+
+def test_multinomial_pandas_records_drawn_seed(conn_context):
+    res = random.multinomial(conn_context, n=5, pvals=(0.5, 0.5), num_random=4,
+                             execute='client', output='pandas')
+    again = random.multinomial(conn_context, n=5, pvals=(0.5, 0.5), num_random=4,
+                               seed=res.attrs['seed'], execute='client', output='pandas')
+    assert again.attrs['seed'] == res.attrs['seed']
+    assert again.equals(res)
@@ -0,0 +1,60 @@
+"""
+Tests of the samplers with execute='view', drawing with RAND() in a SELECT.
+"""
+import numpy as np
+import pytest
+from hana_ml.algorithms.pal import random
+
+def test_view_is_lazy(conn_context):
+    res = random.uniform(conn_context, low=1, high=3, num_random=10, execute='view')
+    assert res.select_statement == (
+        'SELECT CAST("GENERATED_PERIOD_START" AS INTEGER) AS "ID", '
+        'CAST((1.0) + ((3.0) - (1.0)) * RAND() AS DOUBLE) AS "GENERATED_NUMBER" '
+        'FROM SERIES_GENERATE_INTEGER(1, 0, 10)')
+    statements = conn_context.connection.statements
+    assert not [sql for sql in statements if 'PAL_' in sql or sql.startswith('CREATE')]
+    assert not [sql for sql in statements if res.select_statement in sql]
+
+@pytest.mark.parametrize('sampler, kwargs, expected', [
+    ('normal', {'mean': 1, 'sigma': 2}, 'SQRT(-2 * LN(1 - RAND()))'),
+    ('lognormal', {}, 'EXP('),
+    ('exponential', {'lamb': 4}, '-LN(1 - RAND()) / (4.0)'),
+    ('bernoulli', {'p': 0.25}, 'CASE WHEN RAND() < (0.25) THEN 1 ELSE 0 END'),
+    ('cauchy', {}, 'TAN('),
+    ('gumbel', {}, 'LN(-LN(1 - RAND()))'),
+    ('weibull', {'shape': 2}, 'POWER(-LN(1 - RAND()), 1 / (2.0))'),
+])
+def test_view_expressions(conn_context, sampler, kwargs, expected):
+    res = getattr(random, sampler)(conn_context, num_random=5, execute='view', **kwargs)
+    assert expected in res.select_statement
+    assert res.select_statement.endswith('FROM SERIES_GENERATE_INTEGER(1, 0, 5)')
+
+def test_view_numpy(conn_context):
+    conn_context.connection.rows = [(i, 0.5 * i) for i in range(4)]
+    res = random.uniform(conn_context, num_random=4, execute='view', output='numpy')
+    np.testing.assert_array_equal(res, [0.0, 0.5, 1.0, 1.5])
+    assert conn_context.connection.statements_with('SERIES_GENERATE_INTEGER(1, 0, 4)')
+
+def test_view_rejects_seed(conn_context):
+    with pytest.raises(ValueError, match="seed cannot be used with execute='view'"):
+        random.uniform(conn_context, num_random=4, seed=3, execute='view')
+
+def test_view_seed_checked_before_query(conn_context):
+    with pytest.raises(ValueError, match="seed cannot be used with execute='view'"):
+        random.normal(conn_context, num_random=0, seed=3, execute='view', output='numpy')
+    assert not conn_context.connection.statements_with('SERIES_GENERATE_INTEGER')
+
+def test_view_no_samples(conn_context):
+    res = random.uniform(conn_context, num_random=0, execute='view')
+    assert res.select_statement.endswith('FROM SERIES_GENERATE_INTEGER(1, 0, 1) WHERE 1 = 0')
+    samples = random.uniform(conn_context, num_random=0, execute='view', output='numpy')
+    assert samples.shape == (0,)
+    assert not conn_context.connection.statements_with('SERIES_GENERATE_INTEGER(1, 0, 0)')
+
+def test_view_unsupported_distribution(conn_context):
+    with pytest.raises(ValueError, match="not supported for the gamma distribution"):
+        random.gamma(conn_context, num_random=4, execute='view')
+
+def test_view_negative_num_random(conn_context):
+    with pytest.raises(ValueError):
+        random.uniform(conn_context, num_random=-1, execute='view')